@@ -3,7 +3,6 @@ Qubit-reuse-optimal compilation of quantum ripple carry adder circuits.
 """
 
 import numpy
-from functools import reduce
 from quantum.circuit import Circuit
 
 # Set the length of bit strings for addition
@@ -74,8 +73,8 @@ for i in range(0, qubit_num - 4):
 zero_matrix = numpy.zeros([qubit_num, qubit_num], dtype=int)
 adjacency_matrix = numpy.block([[zero_matrix, b_circuit], [op_matrix, zero_matrix]])
 
-# Iteratively calculate the power of the adjacency matrix
-nilpotent = reduce(numpy.matmul, [adjacency_matrix for _ in range(2 * qubit_num)])
+# Calculate the power of the adjacency matrix by repeated squaring
+nilpotent = numpy.linalg.matrix_power(adjacency_matrix, 2 * qubit_num)
 
 # Check whether the adjacency matrix corresponding to the optimal compilation is nilpotent
 print("\nThe adjacency matrix corresponding to the optimal compilation is nilpotent:", numpy.all(nilpotent == 0))
@@ -5,142 +5,317 @@ Since the source code is not public available, we provide our reimplementation f
 """
 
 
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import numpy
 from typing import List, Tuple
 from quantum.circuit import Circuit
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # run the kernels as plain Python functions if Numba is not available
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# Unsigned constants used by the bitmask kernels, mixing them with signed integers would promote to float in Numba
+_ZERO = numpy.uint64(0)
+_ONE = numpy.uint64(1)
+_M1 = numpy.uint64(0x5555555555555555)
+_M2 = numpy.uint64(0x3333333333333333)
+_M4 = numpy.uint64(0x0F0F0F0F0F0F0F0F)
 
-def reduce_by_dckf(circuit: Circuit, first_qubit_search=False) -> None:
-    r"""Compile a static circuit into an equivalent dynamic circuit by the DCKF algorithm proposed in
-    [Qubit-Reuse Compilation with Mid-Circuit Measurement and Reset, Phys. Rev. X 13, 041057 (2023)].
+
+@njit(cache=True)
+def _popcount_swar(word):
+    r"""Count the number of set bits in a 64-bit word with the SWAR (SIMD within a register) algorithm.
 
     Args:
-        circuit (Circuit): a static circuit
-        first_qubit_search (bool, optional): whether to employ brute-force search over the first measured qubit
+        word (numpy.uint64): a 64-bit word
+
+    Returns:
+        numpy.uint64: the number of set bits
+    """
+    word = word - ((word >> _ONE) & _M1)
+    word = (word & _M2) + ((word >> numpy.uint64(2)) & _M2)
+    word = (word + (word >> numpy.uint64(4))) & _M4
+    word = word + (word >> numpy.uint64(8))
+    word = word + (word >> numpy.uint64(16))
+    word = word + (word >> numpy.uint64(32))
+    return word & numpy.uint64(0x7F)
+
+
+# Without Numba, counting the binary digits in Python is much faster than the SWAR algorithm on NumPy scalars
+_popcount = _popcount_swar if NUMBA_AVAILABLE else lambda word: bin(word).count("1")
+
+
+@njit(cache=True)
+def _pick_next(measured_mask, unmeasured_mask, cones):
+    r"""Identify the unmeasured qubit whose causal cone adds the fewest new input qubits to the measured causal cone.
+
+    Args:
+        measured_mask (numpy.ndarray): bitmask of the causal cone of all measured qubits
+        unmeasured_mask (numpy.ndarray): bitmask of all unmeasured qubits
+        cones (numpy.ndarray): bitmasks of the causal cones of all qubits, one row per qubit
+
+    Returns:
+        int: the next qubit to measure, the last one is returned if multiple qubits share the smallest union
     """
-    def _manage_qubit_reuse(q_register: list, reg_occupation: list, which_qubit: int, edge_addition: list) -> Tuple[list, list]:
-        r"""Update the occupation status in the given quantum register, assign an available unit to the
-        input qubit and record the occupation order of qubits on each unit in order to manage the qubit reuse.
-
-        Args:
-            q_register (list): quantum register to update
-            reg_occupation (list): list to record the occupation order of qubits on each register unit.
-            which_qubit (int): the qubit to assign available unit
-            edge_addition (list): edge addition strategy corresponds to the qubit reuse scheme
-
-        Returns:
-            tuple: a tuple containing the updated quantum register and the updated occupation order of qubits on
-            all register units.
-
-        Note:
-            We use a list to implement quantum register where the value of an element represents a qubit and
-            its index indicates the address of the register unit.
-            A register unit whose value is None is an available unit.
-            We use a list to record the occupation order of qubits on each register unit, where the index of
-            an element is the address of the register unit and the value is a list that record the order in which
-            this unit is occupied by different qubits.
-        """
-        if which_qubit not in q_register:
-            # Identify all unoccupied registers from existing ones
-            available_units = [i for i in range(len(q_register)) if q_register[i] is None]
-            if available_units:  # there exist unoccupied register
-                dynamic_qubit = available_units[0]  # load which_qubit to the first available register
-                # Convert the qubit reuse as an added edge to the DAG of the circuit
-                terminal = terminals[reg_occupation[dynamic_qubit][-1]]
-                root = roots[which_qubit]
-                edge_addition.append((terminal, root))
-                # Record the last qubit that occupies this register
-                reg_occupation[dynamic_qubit].append(which_qubit)
-            else:  # in case where there is no available register, initialize a new register for which qubit
-                dynamic_qubit = len(q_register)
-                reg_occupation.append([which_qubit])
-                q_register.append(which_qubit)
-            q_register[dynamic_qubit] = which_qubit
-
-        return q_register, reg_occupation
-
-    def _construct_measurement_order_by_greedy(first_measured_qubit: int) -> List:
-        r"""Construct the measurement order from the given first measured qubit by greedy heuristic.
-
-        Args:
-            first_measured_qubit: first measured qubit
-
-        Returns:
-            list: a list of added edges corresponds to the qubit-reuse scheme.
-        """
-        measurement_order = []  # initialize a measurement order list
-        unmeasured_qubits = set(range(original_circuit_width))
-        measured_causal_cone = set()  # causal cone of all measured qubits (Cq)
-        qreg, qubit_occupation, edge_addition = [], [], []
-
-        # To measure this qubit, all qubits in its causal cone should be activated
-        activated_qubits = all_causal_cones[first_measured_qubit]
+    num_words = measured_mask.shape[0]
+    next_to_measure = -1
+    union_size = cones.shape[0]
+    for w in range(num_words):
+        unmeasured = unmeasured_mask[w]
+        while unmeasured != _ZERO:
+            lowest_bit = unmeasured & (~unmeasured + _ONE)
+            qubit = 64 * w + numpy.int64(_popcount(lowest_bit - _ONE))
+            size = 0
+            for k in range(num_words):
+                size += numpy.int64(_popcount(measured_mask[k] | cones[qubit, k]))
+            if size <= union_size:
+                next_to_measure = qubit
+                union_size = size
+            unmeasured ^= lowest_bit
+    return next_to_measure
+
+
+def _to_bitmask(qubits, num_words: int) -> numpy.ndarray:
+    r"""Convert a collection of qubits to a bitmask of 64-bit words.
+
+    Args:
+        qubits (Iterable[int]): qubits to set in the bitmask
+        num_words (int): the number of 64-bit words in the bitmask
+
+    Returns:
+        numpy.ndarray: the bitmask of the qubits
+    """
+    mask = numpy.zeros(num_words, dtype=numpy.uint64)
+    for q in qubits:
+        mask[q >> 6] |= _ONE << numpy.uint64(q & 63)
+    return mask
+
+
+def _bitmask_to_qubits(mask: numpy.ndarray) -> List[int]:
+    r"""Convert a bitmask of 64-bit words to the qubits set in it.
+
+    Args:
+        mask (numpy.ndarray): the bitmask of the qubits
+
+    Returns:
+        List[int]: qubits set in the bitmask in ascending order
+    """
+    # Unpack the little-endian bytes of the words with the least significant bit first
+    bits = numpy.unpackbits(mask.astype("<u8", copy=False).view(numpy.uint8), bitorder="little")
+    return numpy.flatnonzero(bits).tolist()
+
+
+def _column_popcount(packed_bits: numpy.ndarray) -> numpy.ndarray:
+    r"""Count the ones in each column of the biadjacency matrix from its packed causal cones.
+
+    Args:
+        packed_bits (numpy.ndarray): bitmasks of the causal cones of all qubits, one row of 64-bit words per qubit
+
+    Returns:
+        numpy.ndarray: the size of the causal cone of each qubit
+    """
+    # Count bits on a byte view of the words, which is independent of the byte order
+    byte_view = numpy.ascontiguousarray(packed_bits).view(numpy.uint8)
+    return numpy.unpackbits(byte_view, axis=1).sum(axis=1, dtype=numpy.int32)
+
+
+def _pick_next_memoized(measured_mask: numpy.ndarray, unmeasured_mask: numpy.ndarray, cones: numpy.ndarray,
+                        memo: dict) -> int:
+    r"""Identify the next qubit to measure, reusing the result of an identical greedy step if there is any.
+
+    Args:
+        measured_mask (numpy.ndarray): bitmask of the causal cone of all measured qubits
+        unmeasured_mask (numpy.ndarray): bitmask of all unmeasured qubits
+        cones (numpy.ndarray): bitmasks of the causal cones of all qubits, one row per qubit
+        memo (dict): greedy steps computed so far, keyed by the two bitmasks
+
+    Returns:
+        int: the next qubit to measure
+    """
+    key = (measured_mask.tobytes(), unmeasured_mask.tobytes())
+    if key not in memo:
+        memo[key] = int(_pick_next(measured_mask, unmeasured_mask, cones))
+    return memo[key]
+
+
+def _manage_qubit_reuse(q_register: list, reg_occupation: list, which_qubit: int, edge_addition: list,
+                        free_units: list, roots: list, terminals: list) -> Tuple[list, list]:
+    r"""Update the occupation status in the given quantum register, assign an available unit to the
+    input qubit and record the occupation order of qubits on each unit in order to manage the qubit reuse.
+
+    Args:
+        q_register (list): quantum register to update
+        reg_occupation (list): list to record the occupation order of qubits on each register unit.
+        which_qubit (int): the qubit to assign available unit
+        edge_addition (list): edge addition strategy corresponds to the qubit reuse scheme
+        free_units (list): a heap of the addresses of all available register units
+        roots (list): a list of root vertices in the DAG of the circuit
+        terminals (list): a list of terminal vertices in the DAG of the circuit
+
+    Returns:
+        tuple: a tuple containing the updated quantum register and the updated occupation order of qubits on
+        all register units.
+
+    Note:
+        We use a list to implement quantum register where the value of an element represents a qubit and
+        its index indicates the address of the register unit.
+        A register unit whose value is None is an available unit.
+        The addresses of available units are also kept in a heap so that the first one can be found directly.
+        We use a list to record the occupation order of qubits on each register unit, where the index of
+        an element is the address of the register unit and the value is a list that record the order in which
+        this unit is occupied by different qubits.
+    """
+    if which_qubit not in q_register:
+        if free_units:  # there exist unoccupied register
+            dynamic_qubit = heapq.heappop(free_units)  # load which_qubit to the first available register
+            # Convert the qubit reuse as an added edge to the DAG of the circuit
+            terminal = terminals[reg_occupation[dynamic_qubit][-1]]
+            root = roots[which_qubit]
+            edge_addition.append((terminal, root))
+            # Record the last qubit that occupies this register
+            reg_occupation[dynamic_qubit].append(which_qubit)
+        else:  # in case where there is no available register, initialize a new register for which qubit
+            dynamic_qubit = len(q_register)
+            reg_occupation.append([which_qubit])
+            q_register.append(which_qubit)
+        q_register[dynamic_qubit] = which_qubit
+
+    return q_register, reg_occupation
+
+
+def _construct_measurement_order_by_greedy(first_measured_qubit: int, all_cones_bits: numpy.ndarray, roots: list,
+                                           terminals: list, memo: dict) -> List:
+    r"""Construct the measurement order from the given first measured qubit by greedy heuristic.
+
+    Args:
+        first_measured_qubit (int): first measured qubit
+        all_cones_bits (numpy.ndarray): bitmasks of the causal cones of all qubits, one row per qubit
+        roots (list): a list of root vertices in the DAG of the circuit
+        terminals (list): a list of terminal vertices in the DAG of the circuit
+        memo (dict): greedy steps computed so far, shared by the runs from different first measured qubits
+
+    Returns:
+        list: a list of added edges corresponds to the qubit-reuse scheme.
+    """
+    original_circuit_width, num_words = all_cones_bits.shape
+    measurement_order = []  # initialize a measurement order list
+    unmeasured_mask = _to_bitmask(range(original_circuit_width), num_words)  # all unmeasured qubits
+    measured_mask = numpy.zeros(num_words, dtype=numpy.uint64)  # causal cone of all measured qubits (Cq)
+    qreg, qubit_occupation, edge_addition, free_units = [], [], [], []
+
+    # To measure this qubit, all qubits in its causal cone should be activated
+    activated_qubits = _bitmask_to_qubits(all_cones_bits[first_measured_qubit])
+    # Manage the activated qubit through a quantum register
+    for q in activated_qubits:
+        qreg, qubit_occupation = _manage_qubit_reuse(qreg, qubit_occupation, q, edge_addition, free_units,
+                                                     roots, terminals)
+
+    # Recycle the register occupied by the measured qubit
+    measured_address = qreg.index(first_measured_qubit)
+    heapq.heappush(free_units, measured_address)
+    qreg[measured_address] = None
+
+    # Update the measurement order
+    measurement_order.append(first_measured_qubit)
+    measured_mask |= all_cones_bits[first_measured_qubit]
+    unmeasured_mask[first_measured_qubit >> 6] &= ~(_ONE << numpy.uint64(first_measured_qubit & 63))
+
+    # Apply greedy strategy to get the complete measurement order
+    while len(measurement_order) != original_circuit_width:
+        # Identify the qubit whose causal cone Cq′ adds the fewest new input qubits to Cq as the next to measure
+        next_to_measure = _pick_next_memoized(measured_mask, unmeasured_mask, all_cones_bits, memo)
+
+        # Qubits in the causal cone of the next measured qubit but have not been measured should be activated
+        activated_qubits = _bitmask_to_qubits(all_cones_bits[next_to_measure] & unmeasured_mask)
         # Manage the activated qubit through a quantum register
         for q in activated_qubits:
-            qreg, qubit_occupation = _manage_qubit_reuse(qreg, qubit_occupation, q, edge_addition)
+            qreg, qubit_occupation = _manage_qubit_reuse(qreg, qubit_occupation, q, edge_addition, free_units,
+                                                         roots, terminals)
 
         # Recycle the register occupied by the measured qubit
-        measured_address = [i for i in range(len(qreg)) if qreg[i] == first_measured_qubit][0]
+        measured_address = qreg.index(next_to_measure)
+        heapq.heappush(free_units, measured_address)
         qreg[measured_address] = None
 
         # Update the measurement order
-        measurement_order.append(first_measured_qubit)
-        measured_causal_cone = measured_causal_cone.union(all_causal_cones[first_measured_qubit])
-        unmeasured_qubits.remove(first_measured_qubit)
-
-        # Apply greedy strategy to get the complete measurement order
-        while len(measurement_order) != original_circuit_width:
-            next_to_measure = None
-            union_size = original_circuit_width
-            # Identify the qubit whose causal cone Cq′ adds the fewest new input qubits to Cq as the next to measure
-            for qubit in unmeasured_qubits:
-                union = measured_causal_cone.union(all_causal_cones[qubit])
-                if len(union) <= union_size:
-                    next_to_measure = qubit
-                    union_size = len(union)
-
-            # Qubits in the causal cone of the next measured qubit but have not been measured should be activated
-            activated_qubits = all_causal_cones[next_to_measure].difference(set(measurement_order))
-            # Manage the activated qubit through a quantum register
-            for q in activated_qubits:
-                qreg, qubit_occupation = _manage_qubit_reuse(qreg, qubit_occupation, q, edge_addition)
-
-            # Recycle the register occupied by the measured qubit
-            measured_address = [i for i in range(len(qreg)) if qreg[i] == next_to_measure][0]
-            qreg[measured_address] = None
-
-            # Update the measurement order
-            measurement_order.append(next_to_measure)
-            measured_causal_cone = measured_causal_cone.union(all_causal_cones[next_to_measure])
-            unmeasured_qubits.remove(next_to_measure)
-
-        return edge_addition
-
-    # Get the biadjacency matrix of the circuit
-    biadjacency_matrix, _ = circuit.get_biadjacency_and_candidate_matrices(method="boolean_matrix")
+        measurement_order.append(next_to_measure)
+        measured_mask |= all_cones_bits[next_to_measure]
+        unmeasured_mask[next_to_measure >> 6] &= ~(_ONE << numpy.uint64(next_to_measure & 63))
+
+    return edge_addition
+
+
+def _greedy_from(first_measured_qubit: int, all_cones_bits: numpy.ndarray, roots: list, terminals: list) -> List:
+    r"""Construct the measurement order from the given first measured qubit in a worker process.
+
+    Args:
+        first_measured_qubit (int): first measured qubit
+        all_cones_bits (numpy.ndarray): bitmasks of the causal cones of all qubits, one row per qubit
+        roots (list): a list of root vertices in the DAG of the circuit
+        terminals (list): a list of terminal vertices in the DAG of the circuit
+
+    Returns:
+        list: a list of added edges corresponds to the qubit-reuse scheme.
+    """
+    return _construct_measurement_order_by_greedy(first_measured_qubit, all_cones_bits, roots, terminals, {})
+
+
+def reduce_by_dckf(circuit: Circuit, first_qubit_search=False, n_jobs=1) -> None:
+    r"""Compile a static circuit into an equivalent dynamic circuit by the DCKF algorithm proposed in
+    [Qubit-Reuse Compilation with Mid-Circuit Measurement and Reset, Phys. Rev. X 13, 041057 (2023)].
+
+    Args:
+        circuit (Circuit): a static circuit
+        first_qubit_search (bool, optional): whether to employ brute-force search over the first measured qubit
+        n_jobs (int, optional): number of processes for the search over the first measured qubit,
+            -1 means all processors
+
+    Note:
+        The greedy runs from different first measured qubits are independent of each other.
+        If ``n_jobs`` is not one, they are distributed to a pool of processes, in which case
+        the calling script should be guarded by ``if __name__ == "__main__":``.
+        Each process then runs without the greedy steps memorized by the other runs, and the pool start-up
+        usually costs more than the search itself. The pool only pays off for very wide circuits.
+    """
     # Original static circuit width
     original_circuit_width = circuit.width
-    # Calculate the causal cone for each measurement
-    all_causal_cones = [set(numpy.where(biadjacency_matrix[:, q] == 1)[0]) for q in range(original_circuit_width)]
+    # Get the causal cone of each measurement as a bitmask, one row of 64-bit words per qubit
+    all_cones_bits = circuit._get_causal_cones_bits()
     # Get the graph representation of the circuit
     graph, roots, terminals = circuit.to_dag()
     new_graph = graph.copy()
+    # The greedy steps are shared by all runs, since runs from different first qubits often pass the same states
+    memo = {}
 
     if first_qubit_search:
         # Employ brute-force search over the first measured qubit
-        optimal_added_edges = []
-        for first_to_measure in range(original_circuit_width):
-            added_edges = _construct_measurement_order_by_greedy(first_to_measure)
-            if len(added_edges) > len(optimal_added_edges):
-                optimal_added_edges = added_edges
+        if n_jobs == 1:
+            all_added_edges = (
+                _construct_measurement_order_by_greedy(first_to_measure, all_cones_bits, roots, terminals, memo)
+                for first_to_measure in range(original_circuit_width)
+            )
+            optimal_added_edges = max(all_added_edges, key=len)
+        else:
+            greedy_from = partial(_greedy_from, all_cones_bits=all_cones_bits, roots=roots, terminals=terminals)
+            with ProcessPoolExecutor(max_workers=None if n_jobs == -1 else n_jobs) as executor:
+                # The first run with the most added edges is kept, as in the sequential search
+                optimal_added_edges = max(executor.map(greedy_from, range(original_circuit_width)), key=len)
 
         # Compile the input static circuit into dynamic circuit with the modified graph and added edges
         new_graph.add_edges_from(optimal_added_edges)
         circuit._reorder_by_dag(new_graph, optimal_added_edges)
     else:
         # Identify the first measured qubit by greedy heuristic
-        first_to_measure = int(numpy.argmin(numpy.sum(biadjacency_matrix, axis=0)))
-        added_edges = _construct_measurement_order_by_greedy(first_to_measure)
+        first_to_measure = int(numpy.argmin(_column_popcount(all_cones_bits)))
+        added_edges = _construct_measurement_order_by_greedy(first_to_measure, all_cones_bits, roots, terminals, memo)
 
         # Compile the input static circuit into dynamic circuit with the modified graph and added edges
         new_graph.add_edges_from(added_edges)
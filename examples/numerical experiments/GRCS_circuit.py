@@ -19,50 +19,50 @@ max_cycle = 15
 #                 "9x9", "9x10", "10x10", "10x11", "11x11", "11x12", "12x12"]
 circuit_size = ["4x5", "5x5", "5x6", "6x6"]
 
-for qubit_num in circuit_size:
-    folder_path = os.path.join(directory_path, qubit_num)
-    for cycle_num in range(min_cycle, max_cycle + 1):
-        inst_name = "inst_" + qubit_num + "_" + str(cycle_num) + "_0.txt"
-        inst_path = os.path.join(folder_path, inst_name)
+# Map each instruction name to the method that adds the gate to a circuit
+gate_handlers = {
+    "h": lambda cir, tokens: cir.h(int(tokens[2])),
+    "cz": lambda cir, tokens: cir.cz([int(tokens[2]), int(tokens[3])]),
+    "t": lambda cir, tokens: cir.t(int(tokens[2])),
+    "x_1_2": lambda cir, tokens: cir.rx(int(tokens[2]), pi / 2),
+    "y_1_2": lambda cir, tokens: cir.ry(int(tokens[2]), pi / 2),
+}
 
-        input_cir = []
-        with open(inst_path, "r") as file:
-            for line in file:
-                input_cir.append(list(line.strip("\n").split(" ")))
+if __name__ == "__main__":
+    for qubit_num in circuit_size:
+        folder_path = os.path.join(directory_path, qubit_num)
+        for cycle_num in range(min_cycle, max_cycle + 1):
+            inst_name = "inst_" + qubit_num + "_" + str(cycle_num) + "_0.txt"
+            inst_path = os.path.join(folder_path, inst_name)
 
-        # Create a quantum circuit
-        cir = Circuit()
+            # Create a quantum circuit
+            cir = Circuit()
 
-        # Construct the quantum circuit
-        for gate in input_cir[1:]:
-            if gate[1] == "h":
-                cir.h(int(gate[2]))
-            elif gate[1] == "cz":
-                cir.cz([int(gate[2]), int(gate[3])])
-            elif gate[1] == "t":
-                cir.t(int(gate[2]))
-            elif gate[1] == "x_1_2":
-                cir.rx(int(gate[2]), pi / 2)
-            elif gate[1] == "y_1_2":
-                cir.ry(int(gate[2]), pi / 2)
-            else:
-                raise NotImplementedError
+            # Construct the quantum circuit while reading the instance file
+            with open(inst_path, "r") as file:
+                next(file)  # the first line is the number of qubits
+                for line in file:
+                    tokens = line.split()
+                    handler = gate_handlers.get(tokens[1])
+                    if handler is None:
+                        raise NotImplementedError
+                    handler(cir, tokens)
 
-        # Measure all qubits
-        cir.measure()
-        original_width = cir.width
+            # Measure all qubits
+            cir.measure()
+            original_width = cir.width
 
-        # Apply random greedy heuristic algorithm to compile the circuit
-        cir.reduce(method="random_greedy", shots=10)
-        compiled_width = cir.width
+            # Apply random greedy heuristic algorithm to compile the circuit
+            cir.reduce(method="random_greedy", shots=10, n_jobs=-1)
+            compiled_width = cir.width
 
-        # Calculate the reducibility factor
-        reducibility_factor = 1 - compiled_width / original_width
+            # Calculate the reducibility factor
+            reducibility_factor = 1 - compiled_width / original_width
 
-        # Print the result
-        print(
-            "circuit instance:", inst_name, "\n" 
-            "original circuit width:", original_width, "\n" 
-            "compiled circuit width:", compiled_width, "\n" 
-            "reducibility factor:", reducibility_factor, "\n"
-        )
+            # Print the result
+            print(
+                "circuit instance:", inst_name, "\n" 
+                "original circuit width:", original_width, "\n" 
+                "compiled circuit width:", compiled_width, "\n" 
+                "reducibility factor:", reducibility_factor, "\n"
+            )
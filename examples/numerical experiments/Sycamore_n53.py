@@ -5,10 +5,11 @@ Numerical experiments of quantum supremacy circuits on 53-qubit Sycamore process
 # Since dynamic circuit compilation is independent of the type of two-qubit gates,
 # all two-qubit gates are implemented as controlled-NOT gates.
 
+import numpy
 from quantum.circuit import Circuit
 
 # Define the two-qubit patterns
-pattern_a = [
+pattern_a = numpy.array([
     [5, 11],
     [6, 12],
     [7, 13],
@@ -33,9 +34,9 @@ pattern_a = [
     [44, 50],
     [45, 51],
     [46, 52],
-]
+], dtype=numpy.int8)
 
-pattern_b = [
+pattern_b = numpy.array([
     [1, 5],
     [2, 6],
     [3, 8],
@@ -55,9 +56,9 @@ pattern_b = [
     [38, 43],
     [39, 44],
     [40, 45],
-]
+], dtype=numpy.int8)
 
-pattern_c = [
+pattern_c = numpy.array([
     [0, 5],
     [1, 6],
     [2, 7],
@@ -81,9 +82,9 @@ pattern_c = [
     [38, 44],
     [39, 45],
     [40, 46],
-]
+], dtype=numpy.int8)
 
-pattern_d = [
+pattern_d = numpy.array([
     [5, 12],
     [6, 13],
     [7, 14],
@@ -104,7 +105,7 @@ pattern_d = [
     [43, 50],
     [44, 51],
     [45, 52],
-]
+], dtype=numpy.int8)
 
 # Define the sequence of different patterns
 patterns = [pattern_a, pattern_b, pattern_c, pattern_d, pattern_c, pattern_d, pattern_a, pattern_b]
@@ -113,26 +114,27 @@ patterns = [pattern_a, pattern_b, pattern_c, pattern_d, pattern_c, pattern_d, pa
 min_cycle = 2
 max_cycle = 24
 
-for cycle in range(min_cycle, max_cycle + 1, 2):
-    # Create a quantum circuit
-    cir = Circuit("Supremacy circuit on Sycamore with 53 qubits")
+# Create a quantum circuit, a circuit with more cycles extends the one with fewer cycles
+cir = Circuit("Supremacy circuit on Sycamore with 53 qubits")
+built_cycle = 0
 
-    # Alternatively apply a layer of single qubit gates and two-qubit gates
-    for i in range(cycle):
+for cycle in range(min_cycle, max_cycle + 1, 2):
+    # Alternatively apply a layer of single qubit gates and two-qubit gates, only the new cycles are added
+    for i in range(built_cycle, cycle):
         # A layer of single qubit gates, Hadamard gates are used for simplicity
-        for j in range(53):
-            cir.h(j)
+        cir.h_batch(range(53))
         # A layer of two-qubit gates between qubit pairs within the given pattern
-        for pair in patterns[i % 8]:
-            cir.cx(pair)
+        cir.cx_batch(patterns[i % 8])
+    built_cycle = cycle
 
-    # Measure all qubits
-    cir.measure()
-    original_width = cir.width
+    # Measure all qubits on a copy of the circuit to keep the circuit extensible
+    cir_cycle = cir.clone()
+    cir_cycle.measure()
+    original_width = cir_cycle.width
 
     # Apply the deterministic greedy algorithm to compile the circuit
-    cir.reduce(method="deterministic_greedy")
-    compiled_width = cir.width
+    cir_cycle.reduce(method="deterministic_greedy")
+    compiled_width = cir_cycle.width
 
     # Calculate the reducibility factor
     reducibility_factor = 1 - compiled_width / original_width
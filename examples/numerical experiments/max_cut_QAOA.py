@@ -3,6 +3,7 @@ Numerical experiments of Max-Cut QAOA circuits on random unweighted 3-regular gr
 """
 
 from math import pi
+import numpy
 import networkx as nx
 from quantum.circuit import Circuit
 
@@ -16,43 +17,38 @@ max_qubit_num = 50
 # Set the number of QAOA unitary layers
 layer_num = 1
 
-for q in range(min_qubit_num, max_qubit_num + 1, 4):
-    for s in range(seed_num):
-        # Generate the random U3R graph
-        u3r_graph = nx.random_regular_graph(3, q, s)
-
-        # Create a quantum circuit
-        cir = Circuit()
-
-        # Construct the Max-Cut QAOA circuit on the random graph
-        # Prepare uniform superposition over all qubits
-        for i in range(q):
-            cir.h(i)
-        # Alternatively apply the problem unitary and the mixing unitary multiple times
-        for p in range(layer_num):
-            # The problem unitary for Max-Cut cen be implemented using Z-Z rotation gates,
-            # which are commutable with each other.
-            # Here CZ gates are employed as substitutes for demonstration.
-            for edge in u3r_graph.edges():
-                cir.cz([edge[0], edge[1]])
-            # The mixing unitary, all rotation angles are set to pi for demonstration.
-            for node in u3r_graph.nodes:
-                cir.rx(node, pi)
-
-        # Measure all qubits
-        cir.measure()
-        original_width = cir.width
-
-        # Add group tags for all commutable CZ gates
-        for gate in cir.gate_history:
-            if gate['name'] == 'cz':
-                gate['group_tag'] = 'z_group'
-            else:
-                gate['group_tag'] = None
-
-        # Apply random greedy heuristic algorithm to compile the QAOA circuit
-        cir.reduce(method="random_greedy", shots=random_shots)
-
-        # Print the result
-        print("Original circuit width:", original_width, "\n"
-              "Compiled circuit width:", cir.width, "\n")
+if __name__ == "__main__":
+    for q in range(min_qubit_num, max_qubit_num + 1, 4):
+        for s in range(seed_num):
+            # Generate the random U3R graph
+            u3r_graph = nx.random_regular_graph(3, q, s)
+            # Extract the edges of the graph as an array of qubit pairs
+            edges = numpy.fromiter((node for edge in u3r_graph.edges() for node in edge), dtype=numpy.int32)
+            edges = edges.reshape(-1, 2)
+            nodes = list(u3r_graph.nodes)
+
+            # Create a quantum circuit
+            cir = Circuit()
+
+            # Construct the Max-Cut QAOA circuit on the random graph
+            # Prepare uniform superposition over all qubits
+            cir.h_batch(range(q))
+            # Alternatively apply the problem unitary and the mixing unitary multiple times
+            for p in range(layer_num):
+                # The problem unitary for Max-Cut cen be implemented using Z-Z rotation gates,
+                # which are commutable with each other.
+                # Here CZ gates are employed as substitutes for demonstration, tagged as a commutable group.
+                cir.cz_batch(edges, group_tag='z_group')
+                # The mixing unitary, all rotation angles are set to pi for demonstration.
+                cir.rx_batch(nodes, pi)
+
+            # Measure all qubits
+            cir.measure()
+            original_width = cir.width
+
+            # Apply random greedy heuristic algorithm to compile the QAOA circuit
+            cir.reduce(method="random_greedy", shots=random_shots, n_jobs=-1)
+
+            # Print the result
+            print("Original circuit width:", original_width, "\n"
+                  "Compiled circuit width:", cir.width, "\n")
@@ -3,7 +3,7 @@ Noisy simulation of the 11-qubit Bernstein–Vazirani algorithm.
 Calibration data are taken from [Benchmarking an 11-qubit quantum computer, Nature Communications 10, 5464 (2019)].
 """
 
-import copy
+import numpy
 from quantum.circuit import Circuit
 from quantum.backends import Backend
 
@@ -38,6 +38,14 @@ logical_physical_mappings = {'BV_11': {0: 3, 1: 0, 2: 2, 3: 4, 4: 5, 5: 6, 6: 7,
                              'BV_3': {0: 3, 1: 0, 2: 1},
                              'BV_2': {0: 3, 1: 1}}
 
+# Fidelity tables indexed by physical qubits
+single_qubit_fidelity_table = numpy.array([single_qubit_fidelity[i] for i in range(len(single_qubit_fidelity))])
+spam_fidelity_table = numpy.array([spam_fidelity[i] for i in range(len(spam_fidelity))])
+two_qubit_fidelity_table = numpy.array(two_qubit_fidelity)
+# Logical qubits to physical qubits mappings as arrays indexed by logical qubits
+logical_physical_tables = {name: numpy.array([mapping[i] for i in range(len(mapping))], dtype=numpy.int8)
+                           for name, mapping in logical_physical_mappings.items()}
+
 
 def add_noise(circuit, mapping) -> "Circuit":
     r"""Add depolarizing noise to each quantum operation in the circuit
@@ -45,50 +53,41 @@ def add_noise(circuit, mapping) -> "Circuit":
 
     Args:
         circuit(Circuit): noiseless quantum circuit
-        mapping(dict): logical qubits to physical qubits mapping
+        mapping(numpy.ndarray): physical qubit of each logical qubit
 
     Returns:
         Circuit: noisy quantum circuit
     """
+    gate_history = circuit.gate_history
+    # Store the gate history as parallel arrays
+    names = numpy.array([gate['name'] for gate in gate_history])
+    is_single = numpy.array([len(gate['which_qubit']) == 1 for gate in gate_history], dtype=bool)
+    qubits_0 = numpy.array([gate['which_qubit'][0] for gate in gate_history], dtype=int)
+    qubits_1 = numpy.array([gate['which_qubit'][1] if len(gate['which_qubit']) > 1 else gate['which_qubit'][0]
+                            for gate in gate_history], dtype=int)
+    # Get the corresponding physical qubits
+    physical_qubits_0 = mapping[qubits_0]
+    physical_qubits_1 = mapping[qubits_1]
+
+    # Calculate the error rates of all gates at once
+    is_spam = is_single & ((names == 'r') | (names == 'm'))  # reset and measurement operations
+    is_gate = is_single & ~is_spam  # other single-qubit gates
+    error_rates = numpy.empty(len(gate_history))
+    error_rates[is_spam] = 1 - spam_fidelity_table[physical_qubits_0[is_spam]]
+    error_rates[is_gate] = 1 - single_qubit_fidelity_table[physical_qubits_0[is_gate]]
+    error_rates[~is_single] = 1 - two_qubit_fidelity_table[physical_qubits_0[~is_single], physical_qubits_1[~is_single]]
+
     noisy_gate_history = []  # noisy circuit instruction list
-    for gate in circuit.gate_history:
-        if len(gate['which_qubit']) == 1:  # single-qubit operation
-            logical_qubit = gate['which_qubit'][0]  # get the logical qubit of the gate
-            physical_qubit = mapping[logical_qubit]  # get the corresponding physical qubit
-            if gate['name'] == 'r':  # reset operation
-                # Calculate the state preparation error rate of the physical qubit
-                error_rate = 1 - spam_fidelity[physical_qubit]
-                # Add a noise to the reset operation
-                noisy_gate_history.append(gate)
-                noisy_gate_history.append({'name': 'depolarizing', 'which_qubit': [logical_qubit],
-                                           'signature': None, 'prob': error_rate})
-            elif gate['name'] == 'm':  # measurement operation
-                # Calculate the measurement error rate of the physical qubit
-                error_rate = 1 - spam_fidelity[physical_qubit]
-                # Add a noise to the measurement
-                noisy_gate_history.append({'name': 'depolarizing', 'which_qubit': [logical_qubit],
-                                           'signature': None, 'prob': error_rate})
-                noisy_gate_history.append(gate)
-            else:  # other single-qubit gate
-                # Calculate the single-qubit gate error rate of the physical qubit
-                error_rate = 1 - single_qubit_fidelity[physical_qubit]
-                # Add a noise to the single-qubit gate
-                noisy_gate_history.append(gate)
-                noisy_gate_history.append({'name': 'depolarizing', 'which_qubit': [logical_qubit],
-                                           'signature': None, 'prob': error_rate})
-        else:  # two-qubit gate
-            logical_qubits = gate['which_qubit']
-            # Get the corresponding physical qubits
-            physical_qubit_0 = mapping[logical_qubits[0]]
-            physical_qubit_1 = mapping[logical_qubits[1]]
-            # Calculate the corresponding two-qubit gate error rate
-            error_rate = 1 - two_qubit_fidelity[physical_qubit_0][physical_qubit_1]
-            # Add depolarizing noise to the two-qubit gate
-            noisy_gate_history.append(gate)
-            noisy_gate_history.append({'name': 'depolarizing', 'which_qubit': [logical_qubits[0]],
-                                       'signature': None, 'prob': error_rate})
-            noisy_gate_history.append({'name': 'depolarizing', 'which_qubit': [logical_qubits[1]],
+    for gate, error_rate in zip(gate_history, error_rates.tolist()):
+        if gate['name'] == 'm' and len(gate['which_qubit']) == 1:  # add a noise before the measurement
+            noisy_gate_history.append({'name': 'depolarizing', 'which_qubit': [gate['which_qubit'][0]],
                                        'signature': None, 'prob': error_rate})
+            noisy_gate_history.append(gate)
+        else:  # add depolarizing noise on each qubit after other operations
+            noisy_gate_history.append(gate)
+            for qubit in gate['which_qubit'][:2]:
+                noisy_gate_history.append({'name': 'depolarizing', 'which_qubit': [qubit],
+                                           'signature': None, 'prob': error_rate})
 
     circuit._history = noisy_gate_history
 
@@ -107,7 +106,7 @@ def reduce_to_given_size(circuit, target_size) -> "Circuit":
         Circuit: Bernstein-Vazirani circuit with specified number of qubits
     """
     # Make a copy of the input circuit
-    compiled_circuit = copy.deepcopy(circuit)
+    compiled_circuit = circuit.clone()
     # Convert the static quantum circuit to its DAG representation
     graph, roots, terminals = compiled_circuit.to_dag(reset=False)
     # All edges corresponding to the optimal compilation
@@ -142,8 +141,8 @@ for i in range(qubit_num - 1):
 cir.x(qubit_num - 1)
 cir.h(qubit_num - 1)
 # Implement the quantum oracle for the hidden string
-for i in range(len(secret_string)):
-    if secret_string[i] == "1":
+for i, bit in enumerate(secret_string):
+    if bit == "1":
         cir.cx([i, qubit_num - 1])
 # Apply another layer of Hadamard gates
 for i in range(qubit_num - 1):
@@ -166,7 +165,7 @@ for size in range(11, 1, -1):
     # Plot the circuit
     compiled_cir.print_circuit()
     # Add noise to the circuit
-    noisy_cir = add_noise(compiled_cir, logical_physical_mappings['BV_' + str(size)])
+    noisy_cir = add_noise(compiled_cir, logical_physical_tables['BV_' + str(size)])
     # Run simulation of the noisy circuit
     noisy_count = noisy_cir.run(shots=shots, backend=Backend.DensityMatrix)['counts']
     # Print the simulation result
@@ -9,62 +9,63 @@ Numerical experiments of the random instantaneous quantum polynomial (IQP) circu
 
 import math
 import random
+import numpy
+from concurrent.futures import ProcessPoolExecutor
 from quantum.circuit import Circuit
 
 
-def random_iqp_circuits(num_qubit, num_gate) -> "Circuit":
+def random_iqp_circuits(num_qubit, num_gate, rng=None) -> "Circuit":
     r"""Generate a random IQP circuit with the specified number of qubits and two-qubit gates.
 
     Args:
         num_qubit(int): the number of qubits in the random IQP circuit
         num_gate(int): the number of two-qubit gates in the random IQP circuit
+        rng(numpy.random.Generator, optional): random generator used to select the qubit pairs
 
     Returns:
         Circuit: a random IQP circuit
     """
+    rng = numpy.random.default_rng() if rng is None else rng
+    # Draw all qubit pairs at once, the target is drawn among the qubits other than the control
+    controls = rng.integers(0, num_qubit, size=num_gate)
+    targets = (controls + rng.integers(1, num_qubit, size=num_gate)) % num_qubit
+    pairs = numpy.stack([controls, targets], axis=1)
+
     # Create a quantum circuit
     circuit = Circuit()
     # Add a layer of Hadamard gates
-    for i in range(num_qubit):
-        circuit.h(i)
+    circuit.h_batch(range(num_qubit))
     # Randomly generate the block circuit D
-    # Here we omit all single-qubit gates and only employ CZ gates to construct the block circuit
-    for j in range(num_gate):
-        qubit = random.sample(range(num_qubit), 2)
-        circuit.cz(qubit)
+    # Here we omit all single-qubit gates and only employ CZ gates to construct the block circuit,
+    # which are tagged as a group of commutable gates
+    circuit.cz_batch(pairs, group_tag='z_group')
     # Add another layer of Hadamard gates
-    for i in range(num_qubit):
-        circuit.h(i)
+    circuit.h_batch(range(num_qubit))
     # Measure all qubits
     circuit.measure()
 
-    # Add group tags for all commutable CZ gates
-    for gate in circuit.gate_history:
-        if gate['name'] == 'cz':
-            gate['group_tag'] = 'z_group'
-        else:
-            gate['group_tag'] = None
-
     return circuit
 
 
-# Set the number of random IQP circuits
-run_times = 10
-# Set the random shots for the random greedy algorithm
-random_shots = 5
-# Set the ratio between the number of two-qubit gates and qubits
-gate_qubit_ratio = 2
-
+def _trial(seed: numpy.random.SeedSequence) -> tuple:
+    r"""Generate a random IQP circuit and compile it by the random greedy heuristic algorithm.
 
-for t in range(run_times):
-    # Randomly select a qubit number between 10 and 40
-    qubit_num = random.randint(10, 40)
+    Args:
+        seed(numpy.random.SeedSequence): seed of the trial
 
+    Returns:
+        tuple: the original circuit width, the number of two-qubit gates and the reducibility factor
+    """
+    rng = numpy.random.default_rng(seed)
+    # Seed the random greedy algorithm from the trial, so that every trial is reproducible in its own process
+    random.seed(int(rng.integers(2 ** 63)))
+    # Randomly select the qubit number between 10 and 40
+    qubit_num = int(rng.integers(10, 41))
     # Calculate the number of two-qubit gates
     gate_num = math.floor(qubit_num * gate_qubit_ratio)
 
     # Generate the random circuit
-    cir = random_iqp_circuits(qubit_num, gate_num)
+    cir = random_iqp_circuits(qubit_num, gate_num, rng)
     original_width = cir.width
 
     # Apply random greedy heuristic algorithm to compile the circuit
@@ -74,7 +75,26 @@ for t in range(run_times):
     # Calculate the reducibility factor
     reducibility_factor = 1 - compiled_width / original_width
 
-    # Print the result
-    print("original circuit width:", original_width, "\n" 
-          "number of two-qubit gates:", gate_num, "\n" 
-          "reducibility factor:", reducibility_factor, "\n")
+    return original_width, gate_num, reducibility_factor
+
+
+# Set the number of random IQP circuits
+run_times = 10
+# Set the random shots for the random greedy algorithm
+random_shots = 5
+# Set the ratio between the number of two-qubit gates and qubits
+gate_qubit_ratio = 2
+# Set the seed of the trials, None for different random IQP circuits in every run
+seed = None
+
+if __name__ == "__main__":
+    # Spawn an independent seed for every trial and run the trials in parallel
+    seeds = numpy.random.SeedSequence(seed).spawn(run_times)
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(_trial, seeds)
+
+        for original_width, gate_num, reducibility_factor in results:
+            # Print the result
+            print("original circuit width:", original_width, "\n"
+                  "number of two-qubit gates:", gate_num, "\n"
+                  "reducibility factor:", reducibility_factor, "\n")
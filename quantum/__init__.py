@@ -2,6 +2,11 @@
 Quantum information processing toolkit.
 """
 
-__all__ = ["backends", "basis", "circuit", "gate", "mcalculus", "noise", "pattern", "state", "utils", "EPSILON"]
+__all__ = [
+    "backends", "basis", "circuit", "gate", "mcalculus", "noise", "pattern", "state", "utils", "EPSILON", "EPSILON_F64"
+]
 
-EPSILON = 1e-14  # error tolerance
+import numpy
+
+EPSILON = 1e-14  # error tolerance to compare with Python floats
+EPSILON_F64 = numpy.float64(EPSILON)  # error tolerance to compare with NumPy scalars
@@ -0,0 +1,118 @@
+"""
+Kernels to build the matrices of rotation gates.
+"""
+
+import cmath
+import math
+import numpy
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # run the kernels as plain Python functions if Numba is not available
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+__all__ = ["NUMBA_AVAILABLE", "rx_matrix", "ry_matrix", "rz_matrix", "u_matrix", "u3_matrix"]
+
+
+@njit(cache=True)
+def rx_matrix(theta: float) -> numpy.ndarray:
+    r"""Build the matrix of Rx gate.
+
+    Args:
+        theta (float): rotation angle
+
+    Returns:
+        numpy.ndarray: Rx gate
+    """
+    cos, off_diagonal = math.cos(theta / 2), -1j * math.sin(theta / 2)
+    matrix = numpy.empty((2, 2), dtype=numpy.complex128)
+    matrix[0, 0] = cos
+    matrix[0, 1] = off_diagonal
+    matrix[1, 0] = off_diagonal
+    matrix[1, 1] = cos
+    return matrix
+
+
+@njit(cache=True)
+def ry_matrix(theta: float) -> numpy.ndarray:
+    r"""Build the matrix of Ry gate.
+
+    Args:
+        theta (float): rotation angle
+
+    Returns:
+        numpy.ndarray: Ry gate
+    """
+    cos, sin = math.cos(theta / 2), math.sin(theta / 2)
+    matrix = numpy.empty((2, 2), dtype=numpy.complex128)
+    matrix[0, 0] = cos
+    matrix[0, 1] = -sin
+    matrix[1, 0] = sin
+    matrix[1, 1] = cos
+    return matrix
+
+
+@njit(cache=True)
+def rz_matrix(theta: float) -> numpy.ndarray:
+    r"""Build the matrix of Rz gate.
+
+    Args:
+        theta (float): rotation angle
+
+    Returns:
+        numpy.ndarray: Rz gate
+    """
+    phase = cmath.exp(-0.5j * theta)
+    matrix = numpy.zeros((2, 2), dtype=numpy.complex128)
+    matrix[0, 0] = phase
+    matrix[1, 1] = phase.conjugate()
+    return matrix
+
+
+@njit(cache=True)
+def u_matrix(theta: float, phi: float, gamma: float) -> numpy.ndarray:
+    r"""Build the matrix of U gate, which is the closed form of :math:`Rz(\phi) Rx(\theta) Rz(\gamma)`.
+
+    Args:
+        theta (float): Rx rotation angle
+        phi (float): left Rz rotation angle
+        gamma (float): right Rz rotation angle
+
+    Returns:
+        numpy.ndarray: U gate
+    """
+    cos, sin = math.cos(theta / 2), math.sin(theta / 2)
+    phase_sum, phase_diff = cmath.exp(0.5j * (phi + gamma)), cmath.exp(0.5j * (phi - gamma))
+    matrix = numpy.empty((2, 2), dtype=numpy.complex128)
+    matrix[0, 0] = cos / phase_sum
+    matrix[0, 1] = -1j * sin / phase_diff
+    matrix[1, 0] = -1j * sin * phase_diff
+    matrix[1, 1] = cos * phase_sum
+    return matrix
+
+
+@njit(cache=True)
+def u3_matrix(theta: float, phi: float, gamma: float) -> numpy.ndarray:
+    r"""Build the matrix of U3 gate, which is the closed form of :math:`Rz(\phi) Ry(\theta) Rz(\gamma)`.
+
+    Args:
+        theta (float): Ry rotation angle
+        phi (float): left Rz rotation angle
+        gamma (float): right Rz rotation angle
+
+    Returns:
+        numpy.ndarray: U3 gate
+    """
+    cos, sin = math.cos(theta / 2), math.sin(theta / 2)
+    phase_sum, phase_diff = cmath.exp(0.5j * (phi + gamma)), cmath.exp(0.5j * (phi - gamma))
+    matrix = numpy.empty((2, 2), dtype=numpy.complex128)
+    matrix[0, 0] = cos / phase_sum
+    matrix[0, 1] = -sin / phase_diff
+    matrix[1, 0] = sin * phase_diff
+    matrix[1, 1] = cos * phase_sum
+    return matrix
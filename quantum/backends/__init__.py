@@ -2,13 +2,18 @@
 Module for quantum computation backends.
 """
 
-from enum import Enum
+from enum import IntEnum
 
 __all__ = ["mbqc", "Backend"]
 
 
-class Backend(Enum):
-    r"""QNET backends."""
-    StateVector = "StateVector"
-    DensityMatrix = "DensityMatrix"
-    MBQC = "MBQC"
+class Backend(IntEnum):
+    r"""QNET backends.
+
+    Note:
+        The backends are integers, so that they are compared as integers and can index a tuple of handlers.
+        Use ``Backend.StateVector.name`` to get the name of a backend.
+    """
+    StateVector = 0
+    DensityMatrix = 1
+    MBQC = 2
@@ -3,16 +3,84 @@ Module for quantum measurement bases.
 """
 
 from argparse import ArgumentTypeError
+from functools import lru_cache
+import cmath
+import math
 import numpy
 from numpy import pi
-from quantum.gate import Gate
 from quantum.state import One, Zero, Plus, Minus
 
 __all__ = ["Basis"]
 
+# Amplitude of the computational basis states in the plus and minus states
+_SQRT_HALF = 1 / math.sqrt(2.0)
+
+
+@lru_cache(maxsize=256)
+def _xy_plane_basis(theta: float) -> numpy.ndarray:
+    r"""Return the XY plane measurement basis :math:`\{R_{z}(\theta)|+\rangle, R_{z}(\theta)|-\rangle\}`.
+
+    Args:
+        theta (float): measurement angle
+
+    Returns:
+        numpy.ndarray: measurement basis, which is cached and read-only
+    """
+    left, right = cmath.exp(-0.5j * theta) * _SQRT_HALF, cmath.exp(0.5j * theta) * _SQRT_HALF
+    basis = numpy.array([[[left], [right]], [[left], [-right]]], dtype=complex)
+    basis.setflags(write=False)
+    return basis
+
+
+@lru_cache(maxsize=256)
+def _yz_plane_basis(theta: float) -> numpy.ndarray:
+    r"""Return the YZ plane measurement basis :math:`\{R_{x}(\theta)|0\rangle, R_{x}(\theta)|1\rangle\}`.
+
+    Args:
+        theta (float): measurement angle
+
+    Returns:
+        numpy.ndarray: measurement basis, which is cached and read-only
+    """
+    cos, sin = math.cos(theta / 2), math.sin(theta / 2)
+    basis = numpy.array([[[cos], [-1j * sin]], [[-1j * sin], [cos]]], dtype=complex)
+    basis.setflags(write=False)
+    return basis
+
+
+@lru_cache(maxsize=256)
+def _xz_plane_basis(theta: float) -> numpy.ndarray:
+    r"""Return the XZ plane measurement basis :math:`\{R_{y}(\theta)|0\rangle, R_{y}(\theta)|1\rangle\}`.
+
+    Args:
+        theta (float): measurement angle
+
+    Returns:
+        numpy.ndarray: measurement basis, which is cached and read-only
+    """
+    cos, sin = math.cos(theta / 2), math.sin(theta / 2)
+    basis = numpy.array([[[cos], [sin]], [[-sin], [cos]]], dtype=complex)
+    basis.setflags(write=False)
+    return basis
+
+
+# Pauli measurement bases, built once on import and shared by all callers
+_X_BASIS = numpy.stack([Plus.SV, Minus.SV])
+_X_BASIS.setflags(write=False)
+_Y_BASIS = _xy_plane_basis(pi / 2)
+_Z_BASIS = numpy.stack([Zero.SV, One.SV])
+_Z_BASIS.setflags(write=False)
+
+# Builders of the measurement bases, looked up by the measurement plane
+_PLANE_DISPATCH = {"XY": _xy_plane_basis, "YZ": _yz_plane_basis, "XZ": _xz_plane_basis}
+
 
 class Basis:
-    r"""Class to obtain a measurement basis."""
+    r"""Class to obtain a measurement basis.
+
+    Note:
+        The returned bases are shared by all callers and hence read-only.
+    """
 
     @classmethod
     def X(cls) -> numpy.ndarray:
@@ -21,7 +89,7 @@ class Basis:
         Returns:
             numpy.ndarray: X basis
         """
-        return numpy.array([Plus.SV, Minus.SV])
+        return _X_BASIS
 
     @classmethod
     def Y(cls) -> numpy.ndarray:
@@ -30,7 +98,7 @@ class Basis:
         Returns:
             numpy.ndarray: Y basis
         """
-        return numpy.array([Gate.Rz(pi / 2) @ Plus.SV, Gate.Rz(pi / 2) @ Minus.SV])
+        return _Y_BASIS
 
     @classmethod
     def Z(cls) -> numpy.ndarray:
@@ -39,7 +107,7 @@ class Basis:
         Returns:
             numpy.ndarray: Z basis
         """
-        return numpy.array([Zero.SV, One.SV])
+        return _Z_BASIS
 
     @classmethod
     def Plane(cls, plane: str, theta: float) -> numpy.ndarray:
@@ -57,17 +125,17 @@ class Basis:
             plane (str): measurement plane, can be 'XY', 'YZ' or 'XZ'
             theta (float): measurement angle
 
+        Note:
+            The basis vectors are computed in closed form and cached for each measurement angle,
+            hence the returned basis is read-only.
+
         Returns:
             numpy.ndarray: measurement basis
         """
-        if plane == "XY":  # XY plane measurement basis
-            return numpy.array([Gate.Rz(theta) @ Plus.SV, Gate.Rz(theta) @ Minus.SV])
-
-        elif plane == "YZ":  # YZ plane measurement basis
-            return numpy.array([Gate.Rx(theta) @ Zero.SV, Gate.Rx(theta) @ One.SV])
-
-        elif plane == "XZ":  # XZ plane measurement basis
-            return numpy.array([Gate.Ry(theta) @ Zero.SV, Gate.Ry(theta) @ One.SV])
-
-        else:
+        # Look up the builder of the measurement basis on the given plane
+        plane_basis = _PLANE_DISPATCH.get(plane)
+        if plane_basis is None:
             raise ArgumentTypeError(f"Input {plane} should be 'XY', 'YZ' or 'XZ'.")
+
+        # Use the float angle as the cache key
+        return plane_basis(float(theta))
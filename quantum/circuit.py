@@ -4,9 +4,10 @@ Module for quantum circuits.
 
 from argparse import ArgumentTypeError
 from enum import Enum
-from typing import List, Tuple, Optional, Union, Any
+from typing import List, Tuple, Optional, Union, Any, Iterable
 import copy
 import itertools
+from concurrent.futures import ProcessPoolExecutor
 from functools import reduce, partial
 
 import numpy
@@ -17,11 +18,12 @@ import networkx as nx
 import pandas as pd
 from networkx import DiGraph, MultiDiGraph
 
-from quantum import EPSILON
 from quantum.gate import Gate
 from quantum.state import PureState, MixedState, Zero
 from quantum.backends import Backend, mbqc
-from quantum.utils import COLOR_TABLE, decompose_to_u_gate, find_keys_by_value, print_progress
+from quantum.utils import (
+    COLOR_TABLE, decompose_to_u_gate, find_keys_by_value, matrix_tolerance, print_progress, pack_bits, unpack_bits
+)
 
 __all__ = ["Circuit"]
 
@@ -88,6 +90,7 @@ class Circuit:
         self.output_ids = None
         self._history = []
         self.__num_qreg_unit = -1
+        self._causal_cones_cache = None
 
     def init_new_qreg_unit(self) -> int:
         r"""Initialize a new quantum register unit.
@@ -188,6 +191,19 @@ class Circuit:
             "Only 'float' and 'int' are supported as the type of rotation angle."
         )
 
+    @staticmethod
+    def __check_probability(prob: Union[float, int]) -> None:
+        r"""Check format and range of the noise probability.
+
+        Args:
+            prob (Union[float, int]): noise probability to check
+        """
+        assert isinstance(prob, float) or isinstance(prob, int), (
+            f"Invalid probability {prob.__repr__()} with {type(prob)} type! "
+            "Only 'float' and 'int' are supported as the type of probability."
+        )
+        assert 0 <= prob <= 1, "`prob` should be between 0 and 1."
+
     @staticmethod
     def __check_qubit_validity(qubit: int) -> None:
         r"""Check validity of the qubit.
@@ -200,6 +216,63 @@ class Circuit:
             f"Only 'int' is supported as the type of qubit index."
         )
 
+    @staticmethod
+    def __check_qubit_array(which_qubits: Union[Iterable[int], numpy.ndarray]) -> List[int]:
+        r"""Check validity of a batch of qubits and convert them to a list of qubit indices.
+
+        Args:
+            which_qubits (Union[Iterable[int], numpy.ndarray]): qubits to check validity
+
+        Returns:
+            List[int]: qubit indices of the Python int type
+        """
+        if isinstance(which_qubits, numpy.ndarray):
+            assert which_qubits.ndim == 1, (
+                f"Invalid qubit indices with shape {which_qubits.shape}! Only one-dimensional arrays are supported."
+            )
+            assert which_qubits.size == 0 or numpy.issubdtype(which_qubits.dtype, numpy.integer), (
+                f"Invalid qubit indices with {which_qubits.dtype} type! "
+                "Only integer types are supported as qubit indices."
+            )
+            return which_qubits.tolist()
+
+        # Check other iterables directly, a round trip through numpy is slower for Python lists
+        qubits = list(which_qubits)
+        assert all(isinstance(qubit, int) for qubit in qubits), (
+            "Invalid qubit indices! Only 'int' is supported as the type of qubit index."
+        )
+        return qubits
+
+    @staticmethod
+    def __check_qubit_pair_array(pairs: Union[List[List[int]], numpy.ndarray]) -> List[List[int]]:
+        r"""Check validity of a batch of qubit pairs and convert them to a list of qubit index pairs.
+
+        Args:
+            pairs (Union[List[List[int]], numpy.ndarray]): qubit pairs in the order of [control, target]
+
+        Returns:
+            List[List[int]]: qubit index pairs of the Python int type
+        """
+        if isinstance(pairs, numpy.ndarray):
+            pairs = pairs.reshape(-1, 2)
+            assert pairs.size == 0 or numpy.issubdtype(pairs.dtype, numpy.integer), (
+                f"Invalid qubit indices with {pairs.dtype} type! Only integer types are supported as qubit indices."
+            )
+            if numpy.any(pairs[:, 0] == pairs[:, 1]):
+                raise TypeError("Invalid qubit indices!\nThe control qubit must not be the same as the target qubit.")
+            return pairs.tolist()
+
+        # Check a list of pairs directly, a round trip through numpy is slower for Python lists
+        checked_pairs = []
+        for ctrl, targ in pairs:
+            assert isinstance(ctrl, int) and isinstance(targ, int), (
+                f"Invalid qubit indices {ctrl} and {targ}! Only 'int' is supported as the type of qubit index."
+            )
+            if ctrl == targ:
+                raise TypeError("Invalid qubit indices!\nThe control qubit must not be the same as the target qubit.")
+            checked_pairs.append([ctrl, targ])
+        return checked_pairs
+
     def __add_single_qubit_gate(self, name: str, which_qubit: int, signature=None, **params) -> None:
         r"""Add a single qubit gate to the circuit list.
 
@@ -217,7 +290,7 @@ class Circuit:
             for angle in params["angles"]:
                 self.__check_rotation_angle(angle)
         elif name in ["bit_flip", "phase_flip", "bit_phase_flip", "amplitude_damping", "phase_damping", "depolarizing"]:
-            self.__check_rotation_angle(params["prob"])
+            self.__check_probability(params["prob"])
 
         if params.get("condition") is not None:
             assert self.get_qubit_by_mid(params["condition"]) != which_qubit, f"Invalid condition operation!"
@@ -315,6 +388,18 @@ class Circuit:
         """
         self.__add_single_qubit_gate("h", which_qubit, signature, **condition)
 
+    def h_batch(self, which_qubits: Iterable[int]) -> None:
+        r"""Add a Hadamard gate on each of the given qubits.
+
+        Note:
+            This is equivalent to calling ``h`` on the qubits one by one, but appends all gates in a single call.
+
+        Args:
+            which_qubits (Iterable[int]): qubit indices, e.g. a list, a range or an integer ``numpy.ndarray``
+        """
+        qubits = self.__check_qubit_array(which_qubits)
+        self._history.extend({"name": "h", "which_qubit": [qubit], "signature": None} for qubit in qubits)
+
     def x(self, which_qubit: int, signature=None, **condition) -> None:
         r"""Add a Pauli-X gate.
 
@@ -414,6 +499,22 @@ class Circuit:
         """
         self.__add_single_qubit_gate("rx", which_qubit, signature, angle=theta, **condition)
 
+    def rx_batch(self, which_qubits: Iterable[int], theta: Union[float, int]) -> None:
+        r"""Add a rotation gate around x-axis with the same rotation angle on each of the given qubits.
+
+        Note:
+            This is equivalent to calling ``rx`` on the qubits one by one, but appends all gates in a single call.
+
+        Args:
+            which_qubits (Iterable[int]): qubit indices, e.g. a list, a range or an integer ``numpy.ndarray``
+            theta (Union[float, int]): rotation angle
+        """
+        self.__check_rotation_angle(theta)
+        qubits = self.__check_qubit_array(which_qubits)
+        self._history.extend(
+            {"name": "rx", "which_qubit": [qubit], "signature": None, "angle": theta} for qubit in qubits
+        )
+
     def ry(self, which_qubit: int, theta: Union[float, int], signature=None, **condition) -> None:
         r"""Add a rotation gate around y-axis.
 
@@ -572,6 +673,19 @@ class Circuit:
         """
         self.__add_double_qubit_gate("cx", which_qubit, signature)
 
+    def cx_batch(self, pairs: Union[List[List[int]], numpy.ndarray]) -> None:
+        r"""Add a Controlled-X gate on each of the given qubit pairs.
+
+        Note:
+            This is equivalent to calling ``cx`` on the pairs one by one, but appends all gates in a single call.
+
+        Args:
+            pairs (Union[List[List[int]], numpy.ndarray]): qubit pairs in the order of [control, target],
+                e.g. an integer ``numpy.ndarray`` of shape ``(k, 2)``
+        """
+        pairs = self.__check_qubit_pair_array(pairs)
+        self._history.extend({"name": "cx", "which_qubit": pair, "signature": None} for pair in pairs)
+
     def cnot(self, which_qubit: List[int], signature=None) -> None:
         r"""Add a Controlled-NOT gate.
 
@@ -618,7 +732,7 @@ class Circuit:
         """
         self.__add_double_qubit_gate("cy", which_qubit, signature)
 
-    def cz(self, which_qubit: List[int], signature=None) -> None:
+    def cz(self, which_qubit: List[int], signature=None, group_tag=None) -> None:
         r"""Add a Controlled-Z gate.
 
         Let ``which_qubit`` be ``[0, 1]``, the matrix form is:
@@ -638,8 +752,31 @@ class Circuit:
         Args:
             which_qubit (List[int]): a list of qubit indices in the order of [control, target]
             signature (Node, optional): node that implements the Controlled-Z gate
+            group_tag (Any, optional): tag of the group of mutually commutable gates that the gate belongs to
+
+        Note:
+            Gates with the same ``group_tag`` are treated as commutable with each other
+            when constructing the DAG representation of the circuit.
+        """
+        # Only tagged gates carry a group tag
+        params = {} if group_tag is None else {"group_tag": group_tag}
+        self.__add_double_qubit_gate("cz", which_qubit, signature, **params)
+
+    def cz_batch(self, pairs: Union[List[List[int]], numpy.ndarray], group_tag=None) -> None:
+        r"""Add a Controlled-Z gate on each of the given qubit pairs.
+
+        Note:
+            This is equivalent to calling ``cz`` on the pairs one by one, but appends all gates in a single call.
+
+        Args:
+            pairs (Union[List[List[int]], numpy.ndarray]): qubit pairs in the order of [control, target],
+                e.g. an integer ``numpy.ndarray`` of shape ``(k, 2)``
+            group_tag (Any, optional): tag of the group of mutually commutable gates that the gates belong to
         """
-        self.__add_double_qubit_gate("cz", which_qubit, signature)
+        pairs = self.__check_qubit_pair_array(pairs)
+        # Only tagged gates carry a group tag
+        params = {} if group_tag is None else {"group_tag": group_tag}
+        self._history.extend({"name": "cz", "which_qubit": pair, "signature": None, **params} for pair in pairs)
 
     def crx(self, which_qubit: List[int], theta: Union[float, int], signature=None) -> None:
         r"""Add a Controlled-rotation gate around x-axis.
@@ -987,6 +1124,25 @@ class Circuit:
         new_circuit.output_ids = self.output_ids
         return new_circuit
 
+    def clone(self) -> "Circuit":
+        r"""Make an independent copy of the current circuit.
+
+        Note:
+            Unlike ``copy``, the gate history of the new circuit is not shared with the current circuit.
+            Compilation methods only reassign the entries of a gate or rewrite its qubit list,
+            so copying each gate dictionary and its qubit list is enough and much faster than ``copy.deepcopy``.
+
+        Returns:
+            Circuit: an independent copy of the current circuit
+        """
+        new_circuit = Circuit(self.name)
+        new_circuit.agenda = list(self.agenda)
+        new_circuit.output_ids = None if self.output_ids is None else list(self.output_ids)
+        new_circuit._history = [{**gate, "which_qubit": list(gate["which_qubit"])} for gate in self._history]
+        new_circuit.__num_qreg_unit = self.__num_qreg_unit
+        new_circuit._causal_cones_cache = self._causal_cones_cache
+        return new_circuit
+
     def remap_indices(self, remap: Optional[dict] = None, print_index=False) -> None:
         r"""Remap the indices of quantum register.
 
@@ -1356,7 +1512,7 @@ class Circuit:
             u_mat = reduce(lambda mat1, mat2: mat1 if len(row_inv) == 1 else matmul(mat1, mat2), row_inv)
 
             # Drop the gates if the 'u_mat' is an identity matrix
-            if linalg.norm(u_mat - Gate.I()) < EPSILON:
+            if linalg.norm(u_mat - Gate.I()) < matrix_tolerance(u_mat.dtype):
                 continue
             else:
                 theta, phi, gamma = decompose_to_u_gate(u_mat)
@@ -1667,16 +1823,41 @@ class Circuit:
         Returns:
             numpy.ndarray: the biadjacency matrix of the simplified bipartite graph corresponding to a quantum circuit
         """
+        return unpack_bits(self._get_causal_cones_bits(), self.width).transpose()
+
+    def _get_causal_cones_bits(self) -> numpy.ndarray:
+        r"""Get the causal cone of each terminal as a bitmask over the roots.
+
+        Note:
+            The row ``q`` of the returned array packs the column ``q`` of the biadjacency matrix
+            into 64-bit words, i.e. the root ``r`` is in the causal cone of the terminal ``q``
+            if the bit ``r % 64`` of the word ``r // 64`` is set.
+
+            The result is cached on the circuit together with the qubit lists of its gates,
+            so it is recomputed only when the gate history has been modified.
+            The cached array is read-only.
+
+        Returns:
+            numpy.ndarray: the causal cones of all terminals, one row of 64-bit words per terminal
+        """
+        # Identify the gate history by the qubits that each gate acts on
+        history_key = tuple(tuple(gate["which_qubit"]) for gate in self._history)
+        if self._causal_cones_cache is not None and self._causal_cones_cache[0] == history_key:
+            return self._causal_cones_cache[1]
+
         # Initialize the biadjacency matrix of an empty circuit
-        biadjacency_matrix = numpy.identity(self.width, dtype=int)
-        for i, gate in enumerate(self.gate_history):
+        # Each column is stored as a row of 64-bit words so that one bitwise OR handles 64 roots at once
+        packed_columns = pack_bits(numpy.identity(self.width, dtype=int))
+        for gate in self.gate_history:
             if len(gate["which_qubit"]) > 1:  # multi-qubit gate
                 # Update the biadjacency matrix of the circuit after the multi-qubit gate
                 columns_to_or = gate["which_qubit"]
-                result = numpy.logical_or.reduce(biadjacency_matrix[:, columns_to_or], axis=1)
-                biadjacency_matrix[:, columns_to_or] = result[:, numpy.newaxis]
+                packed_columns[columns_to_or] = numpy.bitwise_or.reduce(packed_columns[columns_to_or], axis=0)
 
-        return biadjacency_matrix
+        # Cache the causal cones until the gate history is modified
+        packed_columns.setflags(write=False)
+        self._causal_cones_cache = (history_key, packed_columns)
+        return packed_columns
 
     def is_reducible_graph(self, non_reusable_qubits=None) -> bool:
         r"""Determine if a static circuit is reducible from its graph representation.
@@ -2292,7 +2473,8 @@ class Circuit:
         self.remap_indices(print_index=False)
 
     def _greedy_heuristic(self, candidate_matrix: numpy.ndarray, roots: List[Any],
-                          terminals: List[Any], method: str) -> list:
+                          terminals: List[Any], method: str, rng: Optional[numpy.random.Generator] = None,
+                          temperature=0.0) -> list:
         r"""Apply greedy heuristic algorithm to the candidate matrix of the simplified bipartite graph
         corresponding to a quantum circuit to obtain a list of edges can be added to the graph
         without introducing any directed cycles.
@@ -2302,11 +2484,23 @@ class Circuit:
             roots (List[Any]): a list of root vertices in the graph
             terminals (List[Any]): a list of terminal vertices in the graph
             method (str): specific method to identify the local optimum during each iteration of the greedy algorithm
+            rng (numpy.random.Generator, optional): random generator used by the random selection
+            temperature (float, optional): relative temperature of the Boltzmann selection of candidate edges
+
+        Note:
+            With the random method and a zero temperature, one of the candidate edges with the highest score is
+            selected uniformly at random. With a positive temperature, every candidate edge can be selected with
+            a probability proportional to :math:`\exp((s - s_{max}) / (T s_{max}))`, where :math:`s` is its score,
+            :math:`s_{max}` is the highest score and :math:`T` is the temperature.
+
+            If no random generator is given, a generator is seeded from the global ``random`` module.
 
         Returns:
             list: a list of edges can be added to the simplified bipartite graph
             without introducing any directed cycles
         """
+        if method == "random" and rng is None:
+            rng = numpy.random.default_rng(random.getrandbits(64))
 
         def _add_one_edge_by_greedy(candidate: numpy.ndarray, method=method) -> Tuple[tuple, numpy.ndarray]:
             r"""Identify a candidate edge by greedy heuristic algorithm and update the candidate matrix after
@@ -2343,11 +2537,18 @@ class Circuit:
                 edge = numpy.unravel_index(numpy.argmax(score_matrix), score_matrix.shape)
                 u, v = edge
             elif method == "random":
-                # Randomly select one if multiple candidate edges share the highest score
-                max_score_candidates = numpy.where(score_matrix == numpy.max(score_matrix))
-                index = random.randint(0, len(max_score_candidates[0]) - 1)
-                u = max_score_candidates[0][index]
-                v = max_score_candidates[1][index]
+                max_score = numpy.max(score_matrix)
+                if temperature > 0:
+                    # Select one from all candidate edges with the Boltzmann weights of their scores
+                    candidates = numpy.nonzero(score_matrix)
+                    weights = numpy.exp((score_matrix[candidates] - max_score) / (temperature * max_score))
+                    index = rng.choice(len(weights), p=weights / numpy.sum(weights))
+                else:
+                    # Randomly select one if multiple candidate edges share the highest score
+                    candidates = numpy.where(score_matrix == max_score)
+                    index = rng.integers(len(candidates[0]))
+                u = candidates[0][index]
+                v = candidates[1][index]
                 edge = (u, v)
             else:
                 raise NotImplementedError
@@ -2469,7 +2670,26 @@ class Circuit:
 
         return added_edges
 
-    def reduce_by_greedy(self, method=None, shots=1, draw=False, non_reusable_qubits=None) -> None:
+    def _random_greedy_single_shot(self, candidate_matrix: numpy.ndarray, roots: List[Any], terminals: List[Any],
+                                   seed: numpy.random.SeedSequence, temperature=0.0) -> list:
+        r"""Run the random greedy heuristic algorithm once with the given random seed.
+
+        Args:
+            candidate_matrix (numpy.ndarray): the candidate matrix of the simplified bipartite graph
+            roots (List[Any]): a list of root vertices in the graph
+            terminals (List[Any]): a list of terminal vertices in the graph
+            seed (numpy.random.SeedSequence): seed of the random selection
+            temperature (float, optional): relative temperature of the Boltzmann selection of candidate edges
+
+        Returns:
+            list: a list of edges can be added to the simplified bipartite graph
+            without introducing any directed cycles
+        """
+        return self._greedy_heuristic(candidate_matrix.copy(), roots, terminals, method="random",
+                                      rng=numpy.random.default_rng(seed), temperature=temperature)
+
+    def reduce_by_greedy(self, method=None, shots=1, draw=False, non_reusable_qubits=None, n_jobs=1,
+                         temperature=0.0) -> None:
         r"""Compile a quantum circuit into an equivalent dynamic circuit with fewer qubits
         by the greedy heuristic algorithm.
 
@@ -2478,6 +2698,8 @@ class Circuit:
             shots (optional, int): number of times to run random greedy algorithm
             draw (optional, bool): whether to draw the modified graph with added edges
             non_reusable_qubits (optional, set): a set of qubits that can not be reused during compilation
+            n_jobs (optional, int): number of processes to run the random greedy shots, -1 means all processors
+            temperature (optional, float): relative temperature of the Boltzmann selection in the random greedy shots
 
         Note:
             If there are multiple local optimal candidate edges during one iteration,
@@ -2493,6 +2715,15 @@ class Circuit:
 
             Multiple runs of the deterministic greedy algorithm produce consistent result.
 
+            If 'temperature' is positive, the random greedy algorithm selects every candidate edge with a
+            Boltzmann weight of its score instead of selecting only among the local optima, which explores
+            more diverse solutions across the shots.
+
+            The shots of the random greedy algorithm are independent of each other. The seeds of all shots are
+            spawned at once from the global random generator, so the result does not depend on 'n_jobs'.
+            If 'n_jobs' is not one, the shots are distributed to a pool of processes.
+            Scripts using multiple processes should be guarded by ``if __name__ == "__main__":``.
+
             By default, all unmeasured qubits can not be reused during compilation.
         """
         # Get the graph representation of the circuit
@@ -2519,10 +2750,17 @@ class Circuit:
         # Get a list of edges added to the graph with specified method
         if method == "random" or method is None:
             added_edges = []
+            # Draw the seeds of all shots in one batch
+            seeds = numpy.random.SeedSequence(random.getrandbits(64)).spawn(shots)
+            single_shot = partial(self._random_greedy_single_shot, candidate_matrix, roots, terminals,
+                                  temperature=temperature)
+            if n_jobs == 1:
+                all_new_edges = map(single_shot, seeds)
+            else:
+                with ProcessPoolExecutor(max_workers=None if n_jobs == -1 else n_jobs) as executor:
+                    all_new_edges = list(executor.map(single_shot, seeds))
             # Run random greedy algorithm multiple times and return the dynamic circuit with the minimal width
-            for shot in range(shots):
-                candidate_copy = copy.deepcopy(candidate_matrix)
-                new_edges = self._greedy_heuristic(candidate_copy, roots, terminals, method="random")
+            for new_edges in all_new_edges:
                 if len(new_edges) > len(added_edges):
                     added_edges = new_edges
         elif method == "deterministic":
@@ -3204,7 +3442,8 @@ class Circuit:
         self._reorder_by_dag(modified_graph, added_edges)
         self.remap_indices(print_index=False)
 
-    def reduce(self, method: str, level=None, shots=1, draw=False, non_reusable_qubits=None) -> None:
+    def reduce(self, method: str, level=None, shots=1, draw=False, non_reusable_qubits=None, n_jobs=1,
+               temperature=0.0) -> None:
         r"""Compile a quantum circuit into an equivalent dynamic circuit with fewer qubits by the specified method.
 
         Args:
@@ -3213,6 +3452,8 @@ class Circuit:
             shots (optional, int): the number of times to run random greedy algorithm
             draw (optional, bool): whether to draw the modified graph with added edges
             non_reusable_qubits (set, optional): a set of qubits that can not be reused during compilation
+            n_jobs (optional, int): the number of processes to run random greedy shots, -1 means all processors
+            temperature (optional, float): relative temperature of the Boltzmann selection in random greedy shots
 
         Note:
             There are multiple algorithms supported for the dynamic circuit compilation, including:
@@ -3272,12 +3513,14 @@ class Circuit:
             self.reduce_by_minimum_remaining_values(method="terminal", draw=draw,
                                                     non_reusable_qubits=non_reusable_qubits)
         elif method == "greedy":
-            self.reduce_by_greedy(method="random", shots=shots, draw=draw, non_reusable_qubits=non_reusable_qubits)
+            self.reduce_by_greedy(method="random", shots=shots, draw=draw, non_reusable_qubits=non_reusable_qubits,
+                                  n_jobs=n_jobs, temperature=temperature)
         elif method == "deterministic_greedy":
             self.reduce_by_greedy(method="deterministic", shots=shots, draw=draw,
                                   non_reusable_qubits=non_reusable_qubits)
         elif method == "random_greedy":
-            self.reduce_by_greedy(method="random", shots=shots, draw=draw, non_reusable_qubits=non_reusable_qubits)
+            self.reduce_by_greedy(method="random", shots=shots, draw=draw, non_reusable_qubits=non_reusable_qubits,
+                                  n_jobs=n_jobs, temperature=temperature)
         elif method == "hybrid":
             if level is None:
                 raise ArgumentTypeError("\nPlease specify the hierarchy level of the hybrid algorithm.")
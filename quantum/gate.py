@@ -2,13 +2,99 @@
 Module for quantum gates.
 """
 
+from argparse import ArgumentTypeError
+import cmath
+import math
+from functools import lru_cache
+
 import numpy
 
-__all__ = ["Gate"]
+from quantum._gate_kernels import rx_matrix, ry_matrix, rz_matrix, u_matrix, u3_matrix
+
+__all__ = ["Gate", "GATE_DTYPE", "set_precision"]
+
+
+def _read_only(matrix: numpy.ndarray) -> numpy.ndarray:
+    r"""Mark a gate matrix as read-only so that a cached matrix can be shared by all callers.
+
+    Args:
+        matrix (numpy.ndarray): matrix of a quantum gate
+
+    Returns:
+        numpy.ndarray: the same matrix, which can no longer be modified in place
+    """
+    matrix.setflags(write=False)
+    return matrix
+
+
+# Phase of T gate, e^{i pi / 4}, evaluated once on import
+_T_PHASE = cmath.exp(1j * math.pi / 4)
+
+# Data types of the gate matrices for each precision
+_PRECISIONS = {"double": numpy.complex128, "single": numpy.complex64}
+# Data type of the gate matrices, read it as ``quantum.gate.GATE_DTYPE`` since it is changed by ``set_precision``
+GATE_DTYPE = numpy.complex128
+
+
+def _fixed_gates(dtype: type) -> dict:
+    r"""Build the matrices of the fixed gates with the given data type.
+
+    Args:
+        dtype (type): data type of the matrices
+
+    Returns:
+        dict: read-only matrices of the fixed gates, keyed by the gate names
+    """
+    return {
+        "I": _read_only(numpy.array([[1, 0], [0, 1]], dtype=dtype)),
+        "X": _read_only(numpy.array([[0, 1], [1, 0]], dtype=dtype)),
+        "Y": _read_only(numpy.array([[0, -1j], [1j, 0]], dtype=dtype)),
+        "Z": _read_only(numpy.array([[1, 0], [0, -1]], dtype=dtype)),
+        "H": _read_only(numpy.array([[1, 1], [1, -1]], dtype=dtype) / dtype(math.sqrt(2.0))),
+        "S": _read_only(numpy.array([[1, 0], [0, 1j]], dtype=dtype)),
+        "T": _read_only(numpy.array([[1, 0], [0, _T_PHASE]], dtype=dtype)),
+        "CZ": _read_only(numpy.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, -1]], dtype=dtype)),
+        "CNOT": _read_only(numpy.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=dtype)),
+        "SWAP": _read_only(numpy.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=dtype)),
+    }
+
+
+# Matrices of the fixed gates, shared by all callers
+_FIXED_GATES = _fixed_gates(GATE_DTYPE)
+
+
+def set_precision(precision: str) -> None:
+    r"""Set the floating-point precision of all gate matrices.
+
+    Args:
+        precision (str): 'double' for ``complex128`` matrices or 'single' for ``complex64`` matrices
+
+    Note:
+        Single precision halves the memory of the gate matrices at the cost of an error around 1e-7 per entry.
+        The matrices are promoted to double precision when they act on a double-precision state.
+        The Kraus operators returned by ``Noise`` follow the same precision.
+        Matrices obtained before the call keep their data type.
+    """
+    global GATE_DTYPE, _FIXED_GATES
+
+    if precision not in _PRECISIONS:
+        raise ArgumentTypeError(f"Input {precision} should be 'double' or 'single'.")
+
+    GATE_DTYPE = _PRECISIONS[precision]
+    _FIXED_GATES = _fixed_gates(GATE_DTYPE)
+    # Drop the rotation gates cached with the previous precision
+    for gate in (Gate.Rx, Gate.Ry, Gate.Rz, Gate.U, Gate.U3):
+        gate.cache_clear()
 
 
 class Gate:
-    r"""Class to obtain the matrix of a quantum gate."""
+    r"""Class to obtain the matrix of a quantum gate.
+
+    Note:
+        Matrices of the fixed gates are module-level constants and those of the rotation gates are cached,
+        both are shared by all callers and hence read-only. Make a copy of the matrix before modifying it in place.
+        The matrices are in double precision by default, call ``set_precision`` to switch to single precision.
+    """
 
     @classmethod
     def I(cls) -> numpy.ndarray:
@@ -17,7 +103,7 @@ class Gate:
         Returns:
             numpy.ndarray: identity gate
         """
-        return numpy.array([[1, 0], [0, 1]], dtype=complex)
+        return _FIXED_GATES["I"]
 
     @classmethod
     def X(cls) -> numpy.ndarray:
@@ -26,7 +112,7 @@ class Gate:
         Returns:
             numpy.ndarray: Pauli-X gate
         """
-        return numpy.array([[0, 1], [1, 0]], dtype=complex)
+        return _FIXED_GATES["X"]
 
     @classmethod
     def Y(cls) -> numpy.ndarray:
@@ -35,7 +121,7 @@ class Gate:
         Returns:
             numpy.ndarray: Pauli-Y gate
         """
-        return numpy.array([[0, -1j], [1j, 0]], dtype=complex)
+        return _FIXED_GATES["Y"]
 
     @classmethod
     def Z(cls) -> numpy.ndarray:
@@ -44,7 +130,7 @@ class Gate:
         Returns:
             numpy.ndarray: Pauli-Z gate
         """
-        return numpy.array([[1, 0], [0, -1]], dtype=complex)
+        return _FIXED_GATES["Z"]
 
     @classmethod
     def H(cls) -> numpy.ndarray:
@@ -53,7 +139,7 @@ class Gate:
         Returns:
             numpy.ndarray: Hadamard gate
         """
-        return numpy.array([[1, 1], [1, -1]], dtype=complex) / numpy.sqrt(2.0)
+        return _FIXED_GATES["H"]
 
     @classmethod
     def S(cls) -> numpy.ndarray:
@@ -62,7 +148,7 @@ class Gate:
         Returns:
             numpy.ndarray: phase gate
         """
-        return numpy.array([[1, 0], [0, 1j]], dtype=complex)
+        return _FIXED_GATES["S"]
 
     @classmethod
     def T(cls) -> numpy.ndarray:
@@ -71,9 +157,10 @@ class Gate:
         Returns:
             numpy.ndarray: T gate
         """
-        return numpy.array([[1, 0], [0, numpy.exp(1j * numpy.pi / 4)]], dtype=complex)
+        return _FIXED_GATES["T"]
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def Rx(cls, theta: float) -> numpy.ndarray:
         r"""Return the matrix of Rx gate.
 
@@ -83,12 +170,10 @@ class Gate:
         Returns:
             numpy.ndarray: Rx gate
         """
-        return numpy.array(
-            [[numpy.cos(theta / 2), -1j * numpy.sin(theta / 2)], [-1j * numpy.sin(theta / 2), numpy.cos(theta / 2)]],
-            dtype=complex,
-        )
+        return _read_only(rx_matrix(float(theta)).astype(GATE_DTYPE, copy=False))
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def Ry(cls, theta: float) -> numpy.ndarray:
         r"""Return the matrix of Ry gate.
 
@@ -98,11 +183,10 @@ class Gate:
         Returns:
             numpy.ndarray: Ry gate
         """
-        return numpy.array(
-            [[numpy.cos(theta / 2), -numpy.sin(theta / 2)], [numpy.sin(theta / 2), numpy.cos(theta / 2)]], dtype=complex
-        )
+        return _read_only(ry_matrix(float(theta)).astype(GATE_DTYPE, copy=False))
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def Rz(cls, theta: float) -> numpy.ndarray:
         r"""Return the matrix of Rz gate.
 
@@ -112,9 +196,10 @@ class Gate:
         Returns:
             numpy.ndarray: Rz gate
         """
-        return numpy.array([[numpy.exp(-1j * theta / 2), 0], [0, numpy.exp(1j * theta / 2)]], dtype=complex)
+        return _read_only(rz_matrix(float(theta)).astype(GATE_DTYPE, copy=False))
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def U(cls, theta: float, phi: float, gamma: float) -> numpy.ndarray:
         r"""Return the matrix of U gate.
 
@@ -130,9 +215,10 @@ class Gate:
         Returns:
             numpy.ndarray: U gate
         """
-        return Gate.Rz(phi) @ Gate.Rx(theta) @ Gate.Rz(gamma)
+        return _read_only(u_matrix(float(theta), float(phi), float(gamma)).astype(GATE_DTYPE, copy=False))
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def U3(cls, theta: float, phi: float, gamma: float) -> numpy.ndarray:
         r"""Return the matrix of U3 gate.
 
@@ -148,7 +234,7 @@ class Gate:
         Returns:
             numpy.ndarray: U3 gate
         """
-        return Gate.Rz(phi) @ Gate.Ry(theta) @ Gate.Rz(gamma)
+        return _read_only(u3_matrix(float(theta), float(phi), float(gamma)).astype(GATE_DTYPE, copy=False))
 
     @classmethod
     def CZ(cls) -> numpy.ndarray:
@@ -157,7 +243,7 @@ class Gate:
         Returns:
             numpy.ndarray: controlled-Z gate
         """
-        return numpy.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, -1]], dtype=complex)
+        return _FIXED_GATES["CZ"]
 
     @classmethod
     def CNOT(cls) -> numpy.ndarray:
@@ -166,7 +252,7 @@ class Gate:
         Returns:
             numpy.ndarray: controlled-NOT gate
         """
-        return numpy.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=complex)
+        return _FIXED_GATES["CNOT"]
 
     @classmethod
     def SWAP(cls) -> numpy.ndarray:
@@ -175,4 +261,4 @@ class Gate:
         Returns:
             numpy.ndarray: SWAP gate
         """
-        return numpy.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex)
+        return _FIXED_GATES["SWAP"]
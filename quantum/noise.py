@@ -2,16 +2,82 @@
 Module for quantum noise.
 """
 
-from typing import List
+import math
+from functools import lru_cache
+from typing import List, Tuple
 import numpy
+from quantum import gate
 from quantum.gate import Gate
 
 __all__ = ["Noise"]
 
+# Indices of the Pauli matrices I, X, Y and Z used by each Pauli noise
+_PAULI_IX = (0, 1)
+_PAULI_IY = (0, 2)
+_PAULI_IZ = (0, 3)
+_PAULI_IXYZ = (0, 1, 2, 3)
+
+
+@lru_cache(maxsize=None)
+def _pauli_stack(dtype: type, paulis: Tuple[int, ...]) -> numpy.ndarray:
+    r"""Return a read-only stack of Pauli matrices with the given data type.
+
+    Args:
+        dtype (type): data type of the matrices
+        paulis (Tuple[int, ...]): indices of the Pauli matrices, where 0, 1, 2 and 3 stand for I, X, Y and Z
+
+    Returns:
+        numpy.ndarray: stack of the Pauli matrices
+    """
+    stack = numpy.stack([Gate.I(), Gate.X(), Gate.Y(), Gate.Z()])[list(paulis)].astype(dtype)
+    stack.setflags(write=False)
+    return stack
+
+
+def _pauli_kraus(coefficients: numpy.ndarray, paulis: Tuple[int, ...]) -> numpy.ndarray:
+    r"""Multiply the Pauli matrices by the coefficients of a Pauli noise in one broadcasted multiplication.
+
+    Args:
+        coefficients (numpy.ndarray): coefficients of the Pauli matrices, along the last axis
+        paulis (Tuple[int, ...]): indices of the Pauli matrices, where 0, 1, 2 and 3 stand for I, X, Y and Z
+
+    Returns:
+        numpy.ndarray: Kraus operators in the precision of the gate matrices
+    """
+    dtype = gate.GATE_DTYPE
+    return (coefficients[..., None, None] * _pauli_stack(dtype, paulis)).astype(dtype, copy=False)
+
+
+def _check_probs(probs: numpy.ndarray) -> numpy.ndarray:
+    r"""Check a batch of noise probabilities.
+
+    Args:
+        probs (numpy.ndarray): probabilities of the noises
+
+    Returns:
+        numpy.ndarray: the probabilities as a one-dimensional float array
+    """
+    probs = numpy.asarray(probs, dtype=float).reshape(-1)
+    assert numpy.all((0 <= probs) & (probs <= 1)), "`probs` should be between 0 and 1."
+    return probs
+
 
 class Noise:
     r"""Class to obtain quantum noise models."""
 
+    @classmethod
+    def _BitFlip(cls, prob: float) -> List[numpy.ndarray]:
+        r"""Kraus operators of a quantum bit flip noise, without checking the probability.
+
+        Args:
+            prob (float): a probability already checked to be between 0 and 1
+
+        Returns:
+            List[numpy.ndarray]: a list of kraus operators for the noise
+        """
+        coefficients = numpy.array([math.sqrt(1 - prob), math.sqrt(prob)])
+        return list(_pauli_kraus(coefficients, _PAULI_IX))
+
     @classmethod
     def BitFlip(cls, prob: float) -> List[numpy.ndarray]:
         r"""Kraus operators of a quantum bit flip noise.
@@ -30,7 +96,20 @@ class Noise:
             List[numpy.ndarray]: a list of kraus operators for the noise
         """
         assert 0 <= prob <= 1, "`prob` should be between 0 and 1."
-        return [numpy.sqrt(1 - prob) * Gate.I(), numpy.sqrt(prob) * Gate.X()]
+        return cls._BitFlip(prob)
+
+    @classmethod
+    def _PhaseFlip(cls, prob: float) -> List[numpy.ndarray]:
+        r"""Kraus operators of a quantum phase flip noise, without checking the probability.
+
+        Args:
+            prob (float): a probability already checked to be between 0 and 1
+
+        Returns:
+            List[numpy.ndarray]: a list of kraus operators for the noise
+        """
+        coefficients = numpy.array([math.sqrt(1 - prob), math.sqrt(prob)])
+        return list(_pauli_kraus(coefficients, _PAULI_IZ))
 
     @classmethod
     def PhaseFlip(cls, prob: float) -> List[numpy.ndarray]:
@@ -50,7 +129,20 @@ class Noise:
             List[numpy.ndarray]: a list of kraus operators for the noise
         """
         assert 0 <= prob <= 1, "`prob` should be between 0 and 1."
-        return [numpy.sqrt(1 - prob) * Gate.I(), numpy.sqrt(prob) * Gate.Z()]
+        return cls._PhaseFlip(prob)
+
+    @classmethod
+    def _BitPhaseFlip(cls, prob: float) -> List[numpy.ndarray]:
+        r"""Kraus operators of a quantum bit-phase flip noise, without checking the probability.
+
+        Args:
+            prob (float): a probability already checked to be between 0 and 1
+
+        Returns:
+            List[numpy.ndarray]: a list of kraus operators for the noise
+        """
+        coefficients = numpy.array([math.sqrt(1 - prob), math.sqrt(prob)])
+        return list(_pauli_kraus(coefficients, _PAULI_IY))
 
     @classmethod
     def BitPhaseFlip(cls, prob: float) -> List[numpy.ndarray]:
@@ -70,7 +162,22 @@ class Noise:
             List[numpy.ndarray]: a list of kraus operators for the noise
         """
         assert 0 <= prob <= 1, "`prob` should be between 0 and 1."
-        return [numpy.sqrt(1 - prob) * Gate.I(), numpy.sqrt(prob) * Gate.Y()]
+        return cls._BitPhaseFlip(prob)
+
+    @classmethod
+    def _AmplitudeDamping(cls, prob: float) -> List[numpy.ndarray]:
+        r"""Kraus operators of a quantum amplitude damping noise, without checking the probability.
+
+        Args:
+            prob (float): a probability already checked to be between 0 and 1
+
+        Returns:
+            List[numpy.ndarray]: a list of kraus operators for the noise
+        """
+        return [
+            numpy.array([[1, 0], [0, math.sqrt(1 - prob)]], dtype=gate.GATE_DTYPE),
+            numpy.array([[0, math.sqrt(prob)], [0, 0]], dtype=gate.GATE_DTYPE),
+        ]
 
     @classmethod
     def AmplitudeDamping(cls, prob: float) -> List[numpy.ndarray]:
@@ -98,9 +205,21 @@ class Noise:
             List[numpy.ndarray]: a list of kraus operators for the noise
         """
         assert 0 <= prob <= 1, "`prob` should be between 0 and 1."
+        return cls._AmplitudeDamping(prob)
+
+    @classmethod
+    def _PhaseDamping(cls, prob: float) -> List[numpy.ndarray]:
+        r"""Kraus operators of a quantum phase damping noise, without checking the probability.
+
+        Args:
+            prob (float): a probability already checked to be between 0 and 1
+
+        Returns:
+            List[numpy.ndarray]: a list of kraus operators for the noise
+        """
         return [
-            numpy.array([[1, 0], [0, numpy.sqrt(1 - prob)]], dtype=complex),
-            numpy.array([[0, numpy.sqrt(prob)], [0, 0]], dtype=complex),
+            numpy.array([[1, 0], [0, math.sqrt(1 - prob)]], dtype=gate.GATE_DTYPE),
+            numpy.array([[0, 0], [0, math.sqrt(prob)]], dtype=gate.GATE_DTYPE),
         ]
 
     @classmethod
@@ -129,10 +248,20 @@ class Noise:
             List[numpy.ndarray]: a list of kraus operators for the noise
         """
         assert 0 <= prob <= 1, "`prob` should be between 0 and 1."
-        return [
-            numpy.array([[1, 0], [0, numpy.sqrt(1 - prob)]], dtype=complex),
-            numpy.array([[0, 0], [0, numpy.sqrt(prob)]], dtype=complex),
-        ]
+        return cls._PhaseDamping(prob)
+
+    @classmethod
+    def _Depolarizing(cls, prob: float) -> List[numpy.ndarray]:
+        r"""Kraus operators of a quantum depolarizing noise, without checking the probability.
+
+        Args:
+            prob (float): a probability already checked to be between 0 and 1
+
+        Returns:
+            List[numpy.ndarray]: a list of kraus operators for the noise
+        """
+        coefficients = numpy.array([math.sqrt(1 - prob)] + [math.sqrt(prob / 3)] * 3)
+        return list(_pauli_kraus(coefficients, _PAULI_IXYZ))
 
     @classmethod
     def Depolarizing(cls, prob: float) -> List[numpy.ndarray]:
@@ -154,9 +283,95 @@ class Noise:
             List[numpy.ndarray]: a list of kraus operators for the noise
         """
         assert 0 <= prob <= 1, "`prob` should be between 0 and 1."
-        return [
-            numpy.sqrt(1 - prob) * Gate.I(),
-            numpy.sqrt(prob / 3) * Gate.X(),
-            numpy.sqrt(prob / 3) * Gate.Y(),
-            numpy.sqrt(prob / 3) * Gate.Z(),
-        ]
+        return cls._Depolarizing(prob)
+
+    @classmethod
+    def BitFlip_batch(cls, probs: numpy.ndarray) -> numpy.ndarray:
+        r"""Kraus operators of quantum bit flip noises with a batch of probabilities.
+
+        Args:
+            probs (numpy.ndarray): probabilities of a bit flip, one for each noise
+
+        Returns:
+            numpy.ndarray: Kraus operators of shape (number of noises, 2, 2, 2), see ``BitFlip``
+        """
+        probs = _check_probs(probs)
+        coefficients = numpy.stack([numpy.sqrt(1 - probs), numpy.sqrt(probs)], axis=1)
+        return _pauli_kraus(coefficients, _PAULI_IX)
+
+    @classmethod
+    def PhaseFlip_batch(cls, probs: numpy.ndarray) -> numpy.ndarray:
+        r"""Kraus operators of quantum phase flip noises with a batch of probabilities.
+
+        Args:
+            probs (numpy.ndarray): probabilities of a phase flip, one for each noise
+
+        Returns:
+            numpy.ndarray: Kraus operators of shape (number of noises, 2, 2, 2), see ``PhaseFlip``
+        """
+        probs = _check_probs(probs)
+        coefficients = numpy.stack([numpy.sqrt(1 - probs), numpy.sqrt(probs)], axis=1)
+        return _pauli_kraus(coefficients, _PAULI_IZ)
+
+    @classmethod
+    def BitPhaseFlip_batch(cls, probs: numpy.ndarray) -> numpy.ndarray:
+        r"""Kraus operators of quantum bit-phase flip noises with a batch of probabilities.
+
+        Args:
+            probs (numpy.ndarray): probabilities of a bit-phase flip, one for each noise
+
+        Returns:
+            numpy.ndarray: Kraus operators of shape (number of noises, 2, 2, 2), see ``BitPhaseFlip``
+        """
+        probs = _check_probs(probs)
+        coefficients = numpy.stack([numpy.sqrt(1 - probs), numpy.sqrt(probs)], axis=1)
+        return _pauli_kraus(coefficients, _PAULI_IY)
+
+    @classmethod
+    def AmplitudeDamping_batch(cls, probs: numpy.ndarray) -> numpy.ndarray:
+        r"""Kraus operators of quantum amplitude damping noises with a batch of probabilities.
+
+        Args:
+            probs (numpy.ndarray): damping probabilities, one for each noise
+
+        Returns:
+            numpy.ndarray: Kraus operators of shape (number of noises, 2, 2, 2), see ``AmplitudeDamping``
+        """
+        probs = _check_probs(probs)
+        kraus = numpy.zeros((len(probs), 2, 2, 2), dtype=gate.GATE_DTYPE)
+        kraus[:, 0, 0, 0] = 1
+        kraus[:, 0, 1, 1] = numpy.sqrt(1 - probs)
+        kraus[:, 1, 0, 1] = numpy.sqrt(probs)
+        return kraus
+
+    @classmethod
+    def PhaseDamping_batch(cls, probs: numpy.ndarray) -> numpy.ndarray:
+        r"""Kraus operators of quantum phase damping noises with a batch of probabilities.
+
+        Args:
+            probs (numpy.ndarray): damping probabilities, one for each noise
+
+        Returns:
+            numpy.ndarray: Kraus operators of shape (number of noises, 2, 2, 2), see ``PhaseDamping``
+        """
+        probs = _check_probs(probs)
+        kraus = numpy.zeros((len(probs), 2, 2, 2), dtype=gate.GATE_DTYPE)
+        kraus[:, 0, 0, 0] = 1
+        kraus[:, 0, 1, 1] = numpy.sqrt(1 - probs)
+        kraus[:, 1, 1, 1] = numpy.sqrt(probs)
+        return kraus
+
+    @classmethod
+    def Depolarizing_batch(cls, probs: numpy.ndarray) -> numpy.ndarray:
+        r"""Kraus operators of quantum depolarizing noises with a batch of probabilities.
+
+        Args:
+            probs (numpy.ndarray): parameters of the depolarizing noises, one for each noise
+
+        Returns:
+            numpy.ndarray: Kraus operators of shape (number of noises, 4, 2, 2), see ``Depolarizing``
+        """
+        probs = _check_probs(probs)
+        flip = numpy.sqrt(probs / 3)
+        coefficients = numpy.stack([numpy.sqrt(1 - probs), flip, flip, flip], axis=1)
+        return _pauli_kraus(coefficients, _PAULI_IXYZ)
@@ -8,7 +8,7 @@ from typing import List, Any, Tuple
 import numpy
 from numpy import conj, random, trace, sqrt, reshape, transpose, real, square, abs
 
-from quantum import EPSILON
+from quantum import EPSILON, EPSILON_F64
 from quantum.gate import Gate
 from quantum.noise import Noise
 from quantum.utils import kron, dagger, to_projector, to_superoperator
@@ -275,7 +275,7 @@ class PureState(QuantumState):
         Returns:
             bool: whether the pure quantum state is normalized
         """
-        return abs(self.norm - 1) < EPSILON
+        return abs(self.norm - 1) < EPSILON_F64
 
     def check_operator(self, which_qubit: list, operator: numpy.ndarray) -> None:
         r"""Check the validity of the operator.
@@ -385,12 +385,12 @@ class PureState(QuantumState):
             "cx": Gate.CNOT,
             "cz": Gate.CZ,
             "swap": Gate.SWAP,
-            "bit_flip": Noise.BitFlip,
-            "phase_flip": Noise.PhaseFlip,
-            "bit_phase_flip": Noise.BitPhaseFlip,
-            "amplitude_damping": Noise.AmplitudeDamping,
-            "phase_damping": Noise.PhaseDamping,
-            "depolarizing": Noise.Depolarizing,
+            "bit_flip": Noise._BitFlip,
+            "phase_flip": Noise._PhaseFlip,
+            "bit_phase_flip": Noise._BitPhaseFlip,
+            "amplitude_damping": Noise._AmplitudeDamping,
+            "phase_damping": Noise._PhaseDamping,
+            "depolarizing": Noise._Depolarizing,
         }
 
         for gate in gate_history:
@@ -568,7 +568,7 @@ class PureState(QuantumState):
             Returns:
                 bool: whether the pure quantum state is normalized
             """
-            return abs(self.norm - 1) < EPSILON
+            return abs(self.norm - 1) < EPSILON_F64
 
         def permute_to_front(self, system: Any) -> None:
             r"""Permute a system of the pure quantum substate to the front.
@@ -640,7 +640,9 @@ class PureState(QuantumState):
                 result = 0
                 post_state_vector = state_unnorm[0]
             else:
-                result = random.choice(2, 1, p=[prob_zero, prob_one]).item()
+                # Renormalize the probabilities, which may drift from one with single-precision gates
+                prob_sum = prob_zero + prob_one
+                result = random.choice(2, 1, p=[prob_zero / prob_sum, prob_one / prob_sum]).item()
                 # Normalize the state after measurement
                 post_state_vector = state_unnorm[result] / sqrt(prob[result])
 
@@ -688,7 +690,7 @@ class PureState(QuantumState):
             self_state_list = list(self.matrix)
             # Find an index with the largest absolute value
             idx = self_state_list.index(max(self_state_list, key=abs))
-            if abs(other.matrix[idx]) <= EPSILON:
+            if abs(other.matrix[idx]) <= EPSILON_F64:
                 error = 1
             else:
                 # Calculate the relative phase and erase it
@@ -837,12 +839,12 @@ class MixedState(QuantumState):
             "cx": Gate.CNOT,
             "cz": Gate.CZ,
             "swap": Gate.SWAP,
-            "bit_flip": Noise.BitFlip,
-            "phase_flip": Noise.PhaseFlip,
-            "bit_phase_flip": Noise.BitPhaseFlip,
-            "amplitude_damping": Noise.AmplitudeDamping,
-            "phase_damping": Noise.PhaseDamping,
-            "depolarizing": Noise.Depolarizing,
+            "bit_flip": Noise._BitFlip,
+            "phase_flip": Noise._PhaseFlip,
+            "bit_phase_flip": Noise._BitPhaseFlip,
+            "amplitude_damping": Noise._AmplitudeDamping,
+            "phase_damping": Noise._PhaseDamping,
+            "depolarizing": Noise._Depolarizing,
         }
 
         for gate in gate_history:
@@ -1035,7 +1037,9 @@ class MixedState(QuantumState):
                 result = 0
                 post_state = post_state_unnorm[0]
             else:
-                result = random.choice(2, 1, p=[prob_zero, prob_one]).item()
+                # Renormalize the probabilities, which may drift from one with single-precision gates
+                prob_sum = prob_zero + prob_one
+                result = random.choice(2, 1, p=[prob_zero / prob_sum, prob_one / prob_sum]).item()
                 # Normalize the state after measurement
                 post_state = post_state_unnorm[result] / prob[result]
 
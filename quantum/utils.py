@@ -17,11 +17,14 @@ __all__ = [
     "COLOR_TABLE",
     "kron",
     "complex_log",
+    "matrix_tolerance",
     "decompose_to_u_gate",
     "dagger",
     "to_projector",
     "to_superoperator",
     "find_keys_by_value",
+    "pack_bits",
+    "unpack_bits",
     "print_progress",
     "plot_results",
 ]
@@ -63,6 +66,22 @@ def kron(matrices: List[numpy.ndarray]) -> numpy.ndarray:
     return result
 
 
+def matrix_tolerance(dtype: Any) -> float:
+    r"""Return the error tolerance for matrices of the given data type.
+
+    Note:
+        The tolerance is ``EPSILON`` for double precision and is scaled by the machine epsilon otherwise,
+        e.g. it is about 5e-6 for ``complex64`` matrices obtained after ``quantum.gate.set_precision("single")``.
+
+    Args:
+        dtype (Any): data type of the matrix
+
+    Returns:
+        float: error tolerance
+    """
+    return EPSILON * float(numpy.finfo(dtype).eps / numpy.finfo(numpy.float64).eps)
+
+
 def complex_log(complex_number: complex) -> complex:
     r"""Calculate the logarithm of a complex number.
 
@@ -156,18 +175,22 @@ def decompose_to_u_gate(u_mat: numpy.ndarray) -> Tuple[float, float, float]:
             "Only (2, 2) is supported as the shape of the matrix."
         )
 
+    # Check the unitarity within the tolerance of the matrix precision
+    tolerance = matrix_tolerance(u_mat.dtype)
     u_error = la.norm(matmul(conj(transpose(u_mat)), u_mat) - Gate.I())
-    is_unitary = u_error < EPSILON
+    is_unitary = u_error < tolerance
     if not is_unitary:
         raise ArgumentTypeError(f"Invalid matrix ({u_mat}) with the norm: {u_error}! Only unitary matrix is supported.")
 
+    # Decompose in double precision
+    u_mat = u_mat.astype(complex, copy=False)
     a = u_mat[0][0]
     b = u_mat[0][1]
     d = u_mat[1][0]
     e = u_mat[1][1]
 
-    a_is_zero = abs(a) <= EPSILON
-    d_is_zero = abs(d) <= EPSILON
+    a_is_zero = abs(a) <= tolerance
+    d_is_zero = abs(d) <= tolerance
 
     if a_is_zero:
         theta = pi
@@ -243,6 +266,38 @@ def find_keys_by_value(d: dict, value: Any) -> List[Any]:
     return [k for k, v in d.items() if v == value]
 
 
+def pack_bits(matrix: numpy.ndarray) -> numpy.ndarray:
+    r"""Pack each row of a boolean matrix into 64-bit words.
+
+    The j-th entry of a row is stored in bit ``j % 64`` of the word ``j // 64``.
+
+    Args:
+        matrix (numpy.ndarray): a two-dimensional matrix with zero / one entries
+
+    Returns:
+        numpy.ndarray: a ``uint64`` matrix whose rows are the bit-packed rows of the input matrix
+    """
+    num_rows, num_columns = matrix.shape
+    num_words = max(1, -(-num_columns // 64))
+    packed = numpy.zeros((num_rows, 8 * num_words), dtype=numpy.uint8)
+    packed[:, : -(-num_columns // 8)] = numpy.packbits(matrix != 0, axis=1, bitorder="little")
+    return packed.view("<u8")
+
+
+def unpack_bits(packed: numpy.ndarray, num_columns: int) -> numpy.ndarray:
+    r"""Unpack a bit-packed matrix produced by ``pack_bits``.
+
+    Args:
+        packed (numpy.ndarray): a ``uint64`` matrix whose rows are bit-packed
+        num_columns (int): the number of columns of the unpacked matrix
+
+    Returns:
+        numpy.ndarray: the unpacked matrix with zero / one entries
+    """
+    bytes_view = numpy.ascontiguousarray(packed, dtype="<u8").view(numpy.uint8)
+    return numpy.unpackbits(bytes_view, axis=1, count=num_columns, bitorder="little").astype(int)
+
+
 def print_progress(current_progress: Union[float, int], progress_name: str, track=True) -> None:
     r"""Print a progress bar.
 